@@ -0,0 +1,47 @@
+"""Make applications code/name unique among non-deleted rows
+
+Revision ID: 0a568e9d66df
+Revises: 121293e37358
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a568e9d66df'
+down_revision: Union[str, None] = '121293e37358'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_applications_code_active',
+        'applications',
+        ['code'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_applications_name_active',
+        'applications',
+        ['name'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+        if_not_exists=True,
+    )
+    op.drop_index('ix_applications_code', table_name='applications', if_exists=True)
+    op.drop_index('ix_applications_name', table_name='applications', if_exists=True)
+
+
+def downgrade() -> None:
+    # Fails if a soft-deleted app shares its code/name with a live one
+    op.create_index('ix_applications_code', 'applications', ['code'], unique=True, if_not_exists=True)
+    op.create_index('ix_applications_name', 'applications', ['name'], unique=True, if_not_exists=True)
+    op.drop_index('ix_applications_code_active', table_name='applications', if_exists=True)
+    op.drop_index('ix_applications_name_active', table_name='applications', if_exists=True)
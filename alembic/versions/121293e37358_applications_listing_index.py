@@ -0,0 +1,33 @@
+"""Add applications listing index
+
+Revision ID: 121293e37358
+Revises: 46e9c7fd23fa
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '121293e37358'
+down_revision: Union[str, None] = '46e9c7fd23fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets the admin listing (filter + ORDER BY created_at DESC LIMIT n) skip the sort
+    op.create_index(
+        'ix_applications_listing',
+        'applications',
+        ['deleted_at', 'is_active', sa.text('created_at DESC')],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_listing', table_name='applications', if_exists=True)
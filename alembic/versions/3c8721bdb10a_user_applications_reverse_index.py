@@ -0,0 +1,35 @@
+"""Add user_applications reverse index and fillfactor
+
+Revision ID: 3c8721bdb10a
+Revises: 0a568e9d66df
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8721bdb10a'
+down_revision: Union[str, None] = '0a568e9d66df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # PK (user_id, application_id) covers per-user lookups; this covers "users of app X"
+    op.create_index(
+        'ix_user_applications_app_user',
+        'user_applications',
+        ['application_id', 'user_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+    # Free space per page for assign/remove churn; applies to newly written pages
+    op.execute('ALTER TABLE user_applications SET (fillfactor = 90)')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE user_applications RESET (fillfactor)')
+    op.drop_index('ix_user_applications_app_user', table_name='user_applications', if_exists=True)
@@ -0,0 +1,48 @@
+"""Replace auth_providers unique constraint with a covering unique index
+
+Revision ID: 7f2d4b91c6e0
+Revises: 3c8721bdb10a
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f2d4b91c6e0'
+down_revision: Union[str, None] = '3c8721bdb10a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One unique btree on (provider, provider_user_id) that also answers the login lookup
+    # index-only. last_used_at stays out of INCLUDE so the last-used flush keeps HOT updates.
+    # CONCURRENTLY so logins keep writing auth_providers while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_auth_provider_lookup',
+            'auth_providers',
+            ['provider', 'provider_user_id'],
+            unique=True,
+            postgresql_include=['id', 'user_id', 'password_hash'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    # Same key as the new index; keeping it would make every insert maintain two btrees
+    op.drop_constraint('uq_provider_user', 'auth_providers', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        'uq_provider_user', 'auth_providers', ['provider', 'provider_user_id']
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_auth_provider_lookup',
+            table_name='auth_providers',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
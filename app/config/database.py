@@ -1,9 +1,14 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Callable, Set, Union
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     pass
@@ -13,9 +18,11 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
 )
 
 async_session_maker = async_sessionmaker(
@@ -37,3 +44,63 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+# Strong refs so coroutines scheduled by after-commit callbacks are not garbage-collected
+_after_commit_tasks: Set[asyncio.Task] = set()
+
+
+def run_after_commit(session: Union[AsyncSession, Session], callback: Callable[[], Any]) -> None:
+    """
+    Queue callback to run once the session's outer transaction commits.
+
+    Side effects outside the database (blob deletes, cache invalidation) go here so a
+    failed UPDATE or commit never leaves them applied. Dropped on rollback. A callback
+    may return a coroutine; it is scheduled as a task.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+def _after_commit_done(task: asyncio.Task) -> None:
+    _after_commit_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"After-commit task failed: {task.exception()}")
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        # The commit already happened; a failing callback must not surface as a failed request
+        try:
+            result = callback()
+            if asyncio.iscoroutine(result):
+                task = asyncio.ensure_future(result)
+                _after_commit_tasks.add(task)
+                task.add_done_callback(_after_commit_done)
+        except Exception as e:
+            logger.warning(f"After-commit callback failed: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+async def warm_up_pool(count: int = settings.DB_POOL_WARMUP) -> None:
+    """Open pooled connections up front so the first requests skip the connect handshake."""
+    count = min(count, settings.DB_POOL_SIZE)
+    if count <= 0:
+        return
+
+    async def _checkout() -> None:
+        async with engine.connect():
+            pass
+
+    # Concurrent checkouts, otherwise the pool hands back the same connection each time
+    results = await asyncio.gather(*(_checkout() for _ in range(count)), return_exceptions=True)
+    failed = [r for r in results if isinstance(r, Exception)]
+    if failed:
+        logger.warning(f"Database pool warm-up: {len(failed)}/{count} connections failed: {failed[0]}")
+    else:
+        logger.info(f"Database pool warmed up with {count} connections")
@@ -1,4 +1,5 @@
 from app.core.middleware.error_handler import ErrorHandlerMiddleware, LoggingMiddleware
+from app.core.middleware.client_ip import ClientIPMiddleware
 from app.core.middleware.setup import setup_middleware
 
-__all__ = ["ErrorHandlerMiddleware", "LoggingMiddleware", "setup_middleware"]
+__all__ = ["ErrorHandlerMiddleware", "LoggingMiddleware", "ClientIPMiddleware", "setup_middleware"]
@@ -0,0 +1,33 @@
+"""
+Resolve the client IP once per request.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.settings import settings
+
+
+class ClientIPMiddleware:
+    """
+    Pure ASGI middleware storing the caller's IP in ``request.state.client_ip``.
+
+    Uses the first ``X-Forwarded-For`` hop when TRUST_FORWARDED_FOR is on (only
+    behind a proxy that overwrites the header), else the socket peer address.
+    """
+
+    def __init__(self, app: ASGIApp, trust_forwarded_for: bool = settings.TRUST_FORWARDED_FOR):
+        self.app = app
+        self.trust_forwarded_for = trust_forwarded_for
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            client_ip = None
+            if self.trust_forwarded_for:
+                for name, value in scope["headers"]:
+                    if name == b"x-forwarded-for":
+                        client_ip = value.decode("latin-1").split(",", 1)[0].strip() or None
+                        break
+            if client_ip is None and scope.get("client"):
+                client_ip = scope["client"][0]
+            scope.setdefault("state", {})["client_ip"] = client_ip
+        await self.app(scope, receive, send)
@@ -156,7 +156,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         logger.info(
             f"[{request_id}] → {request.method} {request.url.path} "
-            f"(client: {request.client.host if request.client else 'unknown'})"
+            f"(client: {request.state.client_ip or 'unknown'})"
         )
 
         response = await call_next(request)
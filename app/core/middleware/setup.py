@@ -6,6 +6,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config.settings import settings
 from app.core.middleware.error_handler import ErrorHandlerMiddleware, LoggingMiddleware
+from app.core.middleware.client_ip import ClientIPMiddleware
 
 
 def setup_middleware(app: FastAPI) -> None:
@@ -15,7 +16,7 @@ def setup_middleware(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-    # Middleware order: CORS -> Logging -> Error Handler
+    # Middleware order (outermost first): Client IP -> Error Handler -> Logging -> CORS
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -26,3 +27,5 @@ def setup_middleware(app: FastAPI) -> None:
 
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(ErrorHandlerMiddleware)
+    # Added last so it wraps everything and request.state.client_ip is set for all layers
+    app.add_middleware(ClientIPMiddleware)
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import jwt, JWTError
+from typing import Optional, Dict, Any, Union
+from jose import jwk, jwt, JWTError
+from jose.backends.base import Key
 
 from app.config.settings import settings
 from app.core.exceptions import UnauthorizedException
@@ -19,6 +20,8 @@ def _load_public_key() -> str:
 class TokenService:
     _private_key: Optional[str] = None
     _public_key: Optional[str] = None
+    _verify_key: Optional[Key] = None
+    _signing_key: Optional[Key] = None
 
     @classmethod
     def get_private_key(cls) -> str:
@@ -32,6 +35,20 @@ class TokenService:
             cls._public_key = _load_public_key()
         return cls._public_key
 
+    @classmethod
+    def get_verify_key(cls) -> Key:
+        """Parsed public key, so decode() doesn't re-parse the PEM on every call."""
+        if cls._verify_key is None:
+            cls._verify_key = jwk.construct(cls.get_public_key(), settings.JWT_ALGORITHM)
+        return cls._verify_key
+
+    @classmethod
+    def get_signing_key(cls) -> Key:
+        """Parsed private key, so encode() doesn't re-parse the PEM for every token issued."""
+        if cls._signing_key is None:
+            cls._signing_key = jwk.construct(cls.get_private_key(), settings.JWT_ALGORITHM)
+        return cls._signing_key
+
     @staticmethod
     def create_access_token(
         user_id: str,
@@ -57,7 +74,7 @@ class TokenService:
         if extra_claims:
             payload.update(extra_claims)
         return jwt.encode(
-            payload, TokenService.get_private_key(), algorithm=settings.JWT_ALGORITHM
+            payload, TokenService.get_signing_key(), algorithm=settings.JWT_ALGORITHM
         )
 
     @staticmethod
@@ -82,14 +99,14 @@ class TokenService:
         if device_id:
             payload["device_id"] = device_id
         return jwt.encode(
-            payload, TokenService.get_private_key(), algorithm=settings.JWT_ALGORITHM
+            payload, TokenService.get_signing_key(), algorithm=settings.JWT_ALGORITHM
         )
 
     @staticmethod
-    def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
+    def verify_token(token: Union[str, bytes], token_type: str = "access") -> Dict[str, Any]:
         try:
             payload = jwt.decode(
-                token, TokenService.get_public_key(), algorithms=[settings.JWT_ALGORITHM]
+                token, TokenService.get_verify_key(), algorithms=[settings.JWT_ALGORITHM]
             )
             if payload.get("type") != token_type:
                 raise UnauthorizedException(
@@ -104,7 +121,7 @@ class TokenService:
         try:
             return jwt.decode(
                 token,
-                TokenService.get_public_key(),
+                TokenService.get_verify_key(),
                 algorithms=[settings.JWT_ALGORITHM],
                 options={"verify_exp": False},
             )
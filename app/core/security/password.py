@@ -1,5 +1,13 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# bcrypt releases the GIL, so hashing on a dedicated pool runs in parallel
+# and keeps the event loop free while a hash is being computed.
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
 
 class PasswordService:
     @staticmethod
@@ -9,8 +17,20 @@ class PasswordService:
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode("utf-8")
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HASH_POOL, PasswordService.hash_password, password)
+
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         password_bytes = plain_password.encode("utf-8")
         hashed_bytes = hashed_password.encode("utf-8")
         return bcrypt.checkpw(password_bytes, hashed_bytes)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _HASH_POOL, PasswordService.verify_password, plain_password, hashed_password
+        )
@@ -7,17 +7,40 @@ Support berbagai tipe file (images, documents, videos, dll).
 
 from fastapi import UploadFile
 from typing import List, Tuple, Optional
+import asyncio
 import os
+import threading
 import filetype
 import logging
 import httpx
 from io import BytesIO
+from cachetools import TTLCache
 
 from app.config.settings import settings
 from app.core.exceptions import FileValidationError
 
 logger = logging.getLogger(__name__)
 
+# Signed URL berlaku 7 hari; cache 1 jam jadi URL yang dikembalikan selalu masih valid >6 hari.
+# Path yang sama (icon default, avatar di list) cukup di-sign sekali per worker.
+_SIGNED_URL_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_SIGNED_URL_LOCK = threading.Lock()
+
+# Batas upload bersamaan per proses; create/update meng-upload img+icon paralel, jadi burst
+# request tidak boleh menghabiskan bandwidth dan thread pool default asyncio.to_thread
+_UPLOAD_SEMAPHORE = asyncio.Semaphore(settings.GCS_UPLOAD_CONCURRENCY)
+
+
+def _get_signed_url(gcp_client, path: str) -> Optional[str]:
+    with _SIGNED_URL_LOCK:
+        url = _SIGNED_URL_CACHE.get(path)
+    if url is None:
+        url = gcp_client.get_file_url(path)
+        if url:
+            with _SIGNED_URL_LOCK:
+                _SIGNED_URL_CACHE[path] = url
+    return url
+
 
 async def validate_file_type(file: UploadFile, allowed_types: set) -> str:
     """
@@ -102,10 +125,12 @@ async def validate_file_size(file: UploadFile, max_size: int) -> int:
     """
     logger.debug(f"Validating file size for: {file.filename}")
     
-    # Get file size
-    content = await file.read()
-    file_size = len(content)
-    await file.seek(0)  # Reset file pointer
+    # Starlette already knows the size of parsed multipart uploads; only read as a fallback
+    file_size = file.size
+    if file_size is None:
+        content = await file.read()
+        file_size = len(content)
+        await file.seek(0)  # Reset file pointer
 
     if file_size > max_size:
         max_size_mb = max_size / (1024 * 1024)
@@ -370,13 +395,10 @@ async def upload_file_to_gcp(
     file_size = await validate_file_size(file, max_size)
     logger.debug(f"File validated: {mime_type}, {file_size} bytes")
 
-    # 2. Read file content
-    file_content = await read_file_content(file)
-
-    # 3. Get storage client
+    # 2. Get storage client
     storage_client = get_gcp_storage_client()
 
-    # 4. Generate unique filename with entity path
+    # 3. Generate unique filename with entity path
     if file.filename is None:
         raise FileValidationError("File tidak memiliki filename")
 
@@ -385,13 +407,14 @@ async def upload_file_to_gcp(
     )
     logger.debug(f"Destination path: {destination_path}")
 
-    import asyncio
-    signed_url = await asyncio.to_thread(
-        storage_client.upload_file,
-        file_content=file_content,
-        destination_path=destination_path,
-        content_type=mime_type,
-    )
+    # 4. Stream the spooled upload to GCS instead of reading it all into memory first
+    async with _UPLOAD_SEMAPHORE:
+        signed_url = await asyncio.to_thread(
+            storage_client.upload_fileobj,
+            fileobj=file.file,
+            destination_path=destination_path,
+            content_type=mime_type,
+        )
 
     logger.info(f"Successfully uploaded file to GCP: {destination_path}")
     return (signed_url, destination_path)
@@ -467,7 +490,7 @@ def generate_signed_url_for_path(path: str) -> Optional[str]:
 
     try:
         gcp_client = get_gcp_storage_client()
-        return gcp_client.get_file_url(path)
+        return _get_signed_url(gcp_client, path)
     except Exception as e:
         logger.error(f"Error generating signed URL for path {path}: {e}")
         return None
@@ -500,7 +523,7 @@ def generate_signed_urls_for_paths(paths: List[str]) -> Optional[List[str]]:
         signed_urls = []
         for path in paths:
             if path:
-                url = gcp_client.get_file_url(path)
+                url = _get_signed_url(gcp_client, path)
                 if url:
                     signed_urls.append(url)
         return signed_urls if signed_urls else None
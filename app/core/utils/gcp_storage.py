@@ -7,7 +7,8 @@ Project ID diambil dari credentials JSON, bucket name dari settings.
 """
 
 import os
-from typing import Optional
+import threading
+from typing import BinaryIO, Optional
 from google.cloud import storage
 from google.oauth2 import service_account
 import uuid
@@ -87,6 +88,38 @@ class GCPStorageClient:
             method="GET"
         )
 
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        destination_path: str,
+        content_type: str
+    ) -> str:
+        """
+        Upload file-like object ke GCP bucket (streaming, tanpa copy penuh ke memory)
+
+        Args:
+            fileobj: File object (e.g. UploadFile.file / SpooledTemporaryFile)
+            destination_path: Path tujuan di bucket
+            content_type: MIME type dari file
+
+        Returns:
+            str: Signed URL file yang di-upload
+        """
+        blob = self.bucket.blob(destination_path)
+
+        # rewind=True: validasi sebelumnya sudah membaca header file
+        blob.upload_from_file(
+            fileobj,
+            rewind=True,
+            content_type=content_type
+        )
+
+        return blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(days=7),
+            method="GET"
+        )
+
     def delete_file(self, file_path: str) -> bool:
         """
         Delete file dari GCP bucket
@@ -221,6 +254,8 @@ class GCPStorageClient:
 
 # Singleton instance
 _gcp_storage_client: Optional[GCPStorageClient] = None
+# Dipanggil juga dari worker thread (asyncio.to_thread); lock agar credentials hanya di-load sekali
+_gcp_storage_client_lock = threading.Lock()
 
 
 def get_gcp_storage_client() -> GCPStorageClient:
@@ -247,11 +282,13 @@ def get_gcp_storage_client() -> GCPStorageClient:
     global _gcp_storage_client
 
     if _gcp_storage_client is None:
-        from app.config.settings import settings
-
-        _gcp_storage_client = GCPStorageClient(
-            credentials_path=settings.GCP_CREDENTIALS_PATH,
-            bucket_name=settings.GCP_BUCKET_NAME
-        )
+        with _gcp_storage_client_lock:
+            if _gcp_storage_client is None:
+                from app.config.settings import settings
+
+                _gcp_storage_client = GCPStorageClient(
+                    credentials_path=settings.GCP_CREDENTIALS_PATH,
+                    bucket_name=settings.GCP_BUCKET_NAME
+                )
 
     return _gcp_storage_client
@@ -10,6 +10,8 @@ from app.config.redis import RedisClient
 from app.core.security.firebase import FirebaseService
 from app.core.messaging.engine import message_engine
 from app.grpc import grpc_server
+from app.modules.auth.services import SessionService, SSOSessionService
+from app.modules.auth.utils.last_used_flusher import flush_last_used, run_last_used_flusher
 import logging
 
 logger = logging.getLogger(__name__)
@@ -70,6 +72,13 @@ async def lifespan(app: FastAPI):
         logger.error(f"Redis connection failed: {e}")
         raise RuntimeError(f"Cannot start: Redis unavailable - {e}")
 
+    # Session services only wrap the shared client; reused by every request
+    app.state.session_service = SessionService(redis)
+    app.state.sso_session_service = SSOSessionService(redis)
+
+    # Buffered auth provider last_used_at -> Postgres, batched
+    last_used_flusher = asyncio.create_task(run_last_used_flusher())
+
     # RabbitMQ initialization
     try:
         await message_engine.connect()
@@ -95,6 +104,17 @@ async def lifespan(app: FastAPI):
     logger.info("Stopping gRPC server...")
     await grpc_server.stop()
     logger.info("gRPC server stopped")
+
+    # Stop the last_used flusher and write whatever is still buffered
+    last_used_flusher.cancel()
+    try:
+        await last_used_flusher
+    except asyncio.CancelledError:
+        pass
+    try:
+        await flush_last_used()
+    except Exception as e:
+        logger.warning(f"Final last_used_at flush failed: {e}")
     
     # Disconnect RabbitMQ
     try:
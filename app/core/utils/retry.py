@@ -0,0 +1,31 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def retry_async(
+    factory: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    no_retry: Tuple[Type[BaseException], ...] = (),
+) -> T:
+    """Await factory(), retrying failures with exponential backoff (base_delay * 2**attempt).
+
+    Exceptions in no_retry (e.g. validation errors) are raised immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return await factory()
+        except no_retry:
+            raise
+        except Exception as e:
+            if attempt == attempts - 1:
+                raise
+            delay = base_delay * 2 ** attempt
+            logger.warning(f"Attempt {attempt + 1}/{attempts} failed: {e}; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    raise ValueError("attempts must be >= 1")
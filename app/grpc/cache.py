@@ -0,0 +1,86 @@
+"""
+gRPC Response Caches
+
+Short-lived in-process caches for read-heavy gRPC lookups.
+
+Every process serving gRPC (the API process and each GRPC_WORKERS worker) holds its own
+copy, so user evictions are broadcast over Redis pub/sub after commit. A process that
+misses a broadcast (Redis down, listener reconnecting) serves stale users for at most the TTL.
+"""
+
+import asyncio
+import logging
+from functools import partial
+from typing import Optional
+
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from proto.sso import user_pb2
+from app.config.database import run_after_commit
+from app.config.redis import RedisClient
+from app.modules.users.models import User
+
+logger = logging.getLogger(__name__)
+
+USER_EVICT_CHANNEL = "grpc:user_cache:evict"
+
+# (lookup kind, value) -> UserResponse; messages are never mutated after caching
+_USER_RESPONSES: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+# user_id -> cache keys pointing at that user, for invalidation by id
+_USER_KEYS: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def get_cached_user_response(kind: str, value: str) -> Optional[user_pb2.UserResponse]:
+    """Return the cached UserResponse for a lookup ("id", "email", "phone")."""
+    return _USER_RESPONSES.get((kind, value))
+
+
+def cache_user_response(kind: str, value: str, response: user_pb2.UserResponse) -> None:
+    """Cache a found UserResponse under its lookup key."""
+    key = (kind, value)
+    _USER_RESPONSES[key] = response
+    user_id = response.user.id
+    _USER_KEYS[user_id] = _USER_KEYS.get(user_id, frozenset()) | {key}
+
+
+def invalidate_user_response(user_id: str) -> None:
+    """Drop every cached lookup for the given user."""
+    for key in _USER_KEYS.pop(user_id, ()):
+        _USER_RESPONSES.pop(key, None)
+
+
+async def publish_user_eviction(user_id: str) -> None:
+    """Evict locally and tell every other gRPC process to drop the user. Call after commit."""
+    invalidate_user_response(user_id)
+    try:
+        redis_client = await RedisClient.get_client()
+        await redis_client.publish(USER_EVICT_CHANNEL, user_id)
+    except Exception as e:
+        # The write is already committed; other processes fall back to the TTL
+        logger.warning(f"Failed to broadcast gRPC user cache eviction for {user_id}: {e}")
+
+
+async def run_user_eviction_listener() -> None:
+    """Apply evictions published by any process until cancelled; resubscribes on errors."""
+    while True:
+        try:
+            redis_client = await RedisClient.get_client()
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(USER_EVICT_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        invalidate_user_response(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"gRPC user cache eviction listener failed, retrying: {e}")
+            await asyncio.sleep(1)
+
+
+@event.listens_for(User, "after_update")
+def _evict_on_update(mapper, connection, target: User) -> None:
+    # ORM flushes (REST updates, soft delete, restore); bulk UPDATE statements evict explicitly.
+    # After commit, so a concurrent lookup can't re-cache the still-committed old row
+    run_after_commit(object_session(target), partial(publish_user_eviction, str(target.id)))
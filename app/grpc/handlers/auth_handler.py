@@ -1,6 +1,9 @@
+import asyncio
 import logging
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 
 import grpc
 from google.protobuf.timestamp_pb2 import Timestamp
@@ -8,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from proto.sso import auth_pb2, auth_pb2_grpc
 from app.config.database import async_session_maker
+from app.config.settings import settings
 from app.modules.users.repositories import UserQueries, UserCommands
 from app.modules.auth.repositories import AuthProviderQueries, AuthProviderCommands
 from app.modules.auth.services import (
@@ -25,64 +29,138 @@ from app.core.security import TokenService
 from app.core.exceptions import UnauthorizedException, NotFoundException, ForbiddenException
 from app.core.utils.file_upload import generate_signed_url_for_path
 from app.config.redis import RedisClient
-from app.grpc.utils import datetime_to_timestamp, device_info_to_dict, dict_to_device_info
+from app.grpc.utils import TokenCtx, datetime_to_timestamp, device_info_to_dict, dict_to_device_info
 from app.grpc.converters import user_to_auth_proto, login_result_to_proto
 
 logger = logging.getLogger(__name__)
 
+# Invariant fields of the error responses, copied instead of re-initialised per call
+_VALIDATE_ERROR_TEMPLATE = auth_pb2.ValidateTokenResponse(is_valid=False)
+_LOGIN_ERROR_TEMPLATE = auth_pb2.LoginResponse(success=False, token_type="bearer")
+_REFRESH_ERROR_TEMPLATE = auth_pb2.RefreshResponse(success=False, token_type="bearer")
 
-class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
-    """gRPC Handler for authentication operations."""
 
-    async def _get_session(self) -> AsyncSession:
-        return async_session_maker()
-
-    async def _create_services(self, session: AsyncSession):
-        """Create all required services with dependencies."""
-        user_queries = UserQueries(session)
-        user_commands = UserCommands(session)
-        auth_queries = AuthProviderQueries(session)
-        auth_commands = AuthProviderCommands(session)
-        app_queries = ApplicationQueries(session)
-        
-        redis_client = await RedisClient.get_client()
-        session_service = SessionService(redis_client)
+def _noop_log(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+def _validate_error(message: str) -> auth_pb2.ValidateTokenResponse:
+    response = auth_pb2.ValidateTokenResponse()
+    response.CopyFrom(_VALIDATE_ERROR_TEMPLATE)
+    response.error = message
+    return response
+
+
+def _login_error(message: str) -> auth_pb2.LoginResponse:
+    response = auth_pb2.LoginResponse()
+    response.CopyFrom(_LOGIN_ERROR_TEMPLATE)
+    response.error = message
+    return response
+
+
+def _refresh_error(message: str) -> auth_pb2.RefreshResponse:
+    response = auth_pb2.RefreshResponse()
+    response.CopyFrom(_REFRESH_ERROR_TEMPLATE)
+    response.error = message
+    return response
+
+
+class _ServiceBundle:
+    """Pre-wired repositories and services, rebound to a new DB session per RPC."""
+
+    __slots__ = (
+        "user_queries",
+        "user_commands",
+        "auth_queries",
+        "auth_commands",
+        "app_queries",
+        "session_service",
+        "auth_service",
+        "email_auth_service",
+        "firebase_auth_service",
+    )
+
+    def __init__(self, session: AsyncSession, redis_client):
+        self.user_queries = UserQueries(session)
+        self.user_commands = UserCommands(session)
+        self.auth_queries = AuthProviderQueries(session)
+        self.auth_commands = AuthProviderCommands(session)
+        self.app_queries = ApplicationQueries(session)
+
+        self.session_service = SessionService(redis_client)
         sso_session_service = SSOSessionService(redis_client)
 
-        auth_service = AuthService(
-            user_queries=user_queries,
-            auth_queries=auth_queries,
-            session_service=session_service,
+        self.auth_service = AuthService(
+            user_queries=self.user_queries,
+            session_service=self.session_service,
             sso_session_service=sso_session_service,
-            app_queries=app_queries,
+            app_queries=self.app_queries,
         )
 
-        email_auth_service = EmailAuthService(
-            auth_queries=auth_queries,
-            auth_commands=auth_commands,
-            user_queries=user_queries,
-            session_service=session_service,
+        self.email_auth_service = EmailAuthService(
+            auth_queries=self.auth_queries,
+            auth_commands=self.auth_commands,
+            user_queries=self.user_queries,
+            session_service=self.session_service,
             sso_session_service=sso_session_service,
-            app_queries=app_queries,
+            app_queries=self.app_queries,
         )
 
-        firebase_auth_service = FirebaseAuthService(
-            auth_queries=auth_queries,
-            auth_commands=auth_commands,
-            user_queries=user_queries,
-            user_commands=user_commands,
-            session_service=session_service,
+        self.firebase_auth_service = FirebaseAuthService(
+            auth_queries=self.auth_queries,
+            auth_commands=self.auth_commands,
+            user_queries=self.user_queries,
+            user_commands=self.user_commands,
+            session_service=self.session_service,
             sso_session_service=sso_session_service,
-            app_queries=app_queries,
+            app_queries=self.app_queries,
         )
 
-        return {
-            "user_queries": user_queries,
-            "auth_service": auth_service,
-            "email_auth_service": email_auth_service,
-            "firebase_auth_service": firebase_auth_service,
-            "session_service": session_service,
-        }
+    def bind(self, session: Optional[AsyncSession]) -> None:
+        """Point every repository (and so every use case) at the given session."""
+        self.user_queries.session = session
+        self.user_commands.session = session
+        self.auth_queries.session = session
+        self.auth_commands.session = session
+        self.app_queries.session = session
+
+
+class _ServiceBundlePool:
+    """Bounded free-list of service bundles so RPCs don't rebuild the object graph."""
+
+    __slots__ = ("_free", "_max_size")
+
+    def __init__(self, max_size: int):
+        self._free: deque[_ServiceBundle] = deque()
+        self._max_size = max_size
+
+    @asynccontextmanager
+    async def checkout(self, session: AsyncSession) -> AsyncIterator[_ServiceBundle]:
+        if self._free:
+            bundle = self._free.popleft()
+            bundle.bind(session)
+        else:
+            bundle = _ServiceBundle(session, await RedisClient.get_client())
+        try:
+            yield bundle
+        finally:
+            bundle.bind(None)
+            if len(self._free) < self._max_size:
+                self._free.append(bundle)
+
+
+class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
+    """gRPC Handler for authentication operations."""
+
+    def __init__(self):
+        self._services = _ServiceBundlePool(max_size=settings.GRPC_SERVICE_POOL_SIZE)
+        self._inflight_validations: Dict[bytes, "asyncio.Task[auth_pb2.ValidateTokenResponse]"] = {}
+        self.bind_log_level()
+
+    def bind_log_level(self) -> None:
+        """Resolve per-call log methods once; call again after changing log levels."""
+        self._log_info = logger.info if logger.isEnabledFor(logging.INFO) else _noop_log
+        self._log_debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else _noop_log
 
     async def ValidateToken(
         self,
@@ -90,29 +168,33 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.ValidateTokenResponse:
         """Validate JWT access token and return user data."""
-        logger.info("gRPC ValidateToken called")
+        self._log_debug("gRPC ValidateToken called")
+
+        # Single-flight: concurrent validations of the same token share one lookup
+        token = TokenCtx.from_token(request.access_token)
+        task = self._inflight_validations.get(token.digest)
+        if task is None:
+            task = asyncio.ensure_future(self._validate_token(token))
+            self._inflight_validations[token.digest] = task
+            task.add_done_callback(
+                lambda _: self._inflight_validations.pop(token.digest, None)
+            )
+        return await asyncio.shield(task)
 
+    async def _validate_token(self, token: TokenCtx) -> auth_pb2.ValidateTokenResponse:
         try:
-            payload = TokenService.verify_token(
-                request.access_token, token_type="access"
-            )
+            payload = TokenService.verify_token(token.raw, token_type="access")
             user_id = payload.get("sub")
 
             if not user_id or not isinstance(user_id, str):
-                return auth_pb2.ValidateTokenResponse(
-                    is_valid=False,
-                    error="Invalid token payload",
-                )
+                return _validate_error("Invalid token payload")
 
-            async with await self._get_session() as session:
+            async with async_session_maker() as session:
                 user_queries = UserQueries(session)
                 user = await user_queries.get_by_id(user_id)
 
                 if not user:
-                    return auth_pb2.ValidateTokenResponse(
-                        is_valid=False,
-                        error="User not found",
-                    )
+                    return _validate_error("User not found")
 
                 return auth_pb2.ValidateTokenResponse(
                     is_valid=True,
@@ -120,16 +202,10 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                 )
 
         except UnauthorizedException as e:
-            return auth_pb2.ValidateTokenResponse(
-                is_valid=False,
-                error=str(e.message),
-            )
+            return _validate_error(str(e.message))
         except Exception as e:
-            logger.error(f"Token validation error: {e}")
-            return auth_pb2.ValidateTokenResponse(
-                is_valid=False,
-                error="Token validation failed",
-            )
+            logger.error("Token validation error: %s", e)
+            return _validate_error("Token validation failed")
 
     async def LoginWithEmail(
         self,
@@ -137,13 +213,15 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.LoginResponse:
         """Login with email and password."""
-        logger.info(f"gRPC LoginWithEmail called for: {request.email}")
+        self._log_info("gRPC LoginWithEmail called for: %s", request.email)
 
         try:
-            async with await self._get_session() as session:
-                services = await self._create_services(session)
-                
-                result = await services["email_auth_service"].login(
+            async with (
+                async_session_maker() as session,
+                session.begin(),
+                self._services.checkout(session) as services,
+            ):
+                result = await services.email_auth_service.login(
                     email=request.email,
                     password=request.password,
                     client_id=request.client_id if request.client_id else None,
@@ -152,22 +230,13 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                     fcm_token=request.fcm_token if request.fcm_token else None,
                 )
 
-                await session.commit()
                 return login_result_to_proto(result)
 
         except UnauthorizedException as e:
-            return auth_pb2.LoginResponse(
-                success=False,
-                error=str(e.message),
-                token_type="bearer",
-            )
+            return _login_error(str(e.message))
         except Exception as e:
-            logger.error(f"Email login error: {e}")
-            return auth_pb2.LoginResponse(
-                success=False,
-                error="Login failed",
-                token_type="bearer",
-            )
+            logger.error("Email login error: %s", e)
+            return _login_error("Login failed")
 
     async def LoginWithFirebase(
         self,
@@ -175,12 +244,14 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.LoginResponse:
         """Login with Firebase token."""
-        logger.info("gRPC LoginWithFirebase called")
+        self._log_info("gRPC LoginWithFirebase called")
 
         try:
-            async with await self._get_session() as session:
-                services = await self._create_services(session)
-
+            async with (
+                async_session_maker() as session,
+                session.begin(),
+                self._services.checkout(session) as services,
+            ):
                 firebase_request = FirebaseLoginRequest(
                     firebase_token=request.firebase_token,
                     client_id=request.client_id if request.client_id else None,
@@ -188,27 +259,18 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                     fcm_token=request.fcm_token if request.fcm_token else None,
                 )
 
-                result = await services["firebase_auth_service"].login(
+                result = await services.firebase_auth_service.login(
                     request=firebase_request,
                     ip_address=request.ip_address if request.ip_address else None,
                 )
 
-                await session.commit()
                 return login_result_to_proto(result)
 
         except UnauthorizedException as e:
-            return auth_pb2.LoginResponse(
-                success=False,
-                error=str(e.message),
-                token_type="bearer",
-            )
+            return _login_error(str(e.message))
         except Exception as e:
-            logger.error(f"Firebase login error: {e}")
-            return auth_pb2.LoginResponse(
-                success=False,
-                error="Login failed",
-                token_type="bearer",
-            )
+            logger.error("Firebase login error: %s", e)
+            return _login_error("Login failed")
 
     async def RefreshToken(
         self,
@@ -216,13 +278,14 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.RefreshResponse:
         """Refresh access token."""
-        logger.info("gRPC RefreshToken called")
+        self._log_info("gRPC RefreshToken called")
 
         try:
-            async with await self._get_session() as session:
-                services = await self._create_services(session)
-
-                result = await services["auth_service"].refresh_token(
+            async with (
+                async_session_maker() as session,
+                self._services.checkout(session) as services,
+            ):
+                result = await services.auth_service.refresh_token(
                     refresh_token=request.refresh_token,
                     device_id=request.device_id,
                 )
@@ -236,18 +299,10 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                 )
 
         except UnauthorizedException as e:
-            return auth_pb2.RefreshResponse(
-                success=False,
-                error=str(e.message),
-                token_type="bearer",
-            )
+            return _refresh_error(str(e.message))
         except Exception as e:
-            logger.error(f"Token refresh error: {e}")
-            return auth_pb2.RefreshResponse(
-                success=False,
-                error="Token refresh failed",
-                token_type="bearer",
-            )
+            logger.error("Token refresh error: %s", e)
+            return _refresh_error("Token refresh failed")
 
     async def ExchangeSSOToken(
         self,
@@ -255,13 +310,15 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.LoginResponse:
         """Exchange SSO token for app-specific tokens."""
-        logger.info(f"gRPC ExchangeSSOToken called for client: {request.client_id}")
+        self._log_info("gRPC ExchangeSSOToken called for client: %s", request.client_id)
 
         try:
-            async with await self._get_session() as session:
-                services = await self._create_services(session)
-
-                result = await services["auth_service"].exchange_sso_token(
+            async with (
+                async_session_maker() as session,
+                session.begin(),
+                self._services.checkout(session) as services,
+            ):
+                result = await services.auth_service.exchange_sso_token(
                     sso_token=request.sso_token,
                     client_id=request.client_id,
                     device_info=device_info_to_dict(request.device_info) if request.HasField("device_info") else None,
@@ -269,22 +326,13 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                     fcm_token=request.fcm_token if request.fcm_token else None,
                 )
 
-                await session.commit()
                 return login_result_to_proto(result)
 
         except (UnauthorizedException, ForbiddenException, NotFoundException) as e:
-            return auth_pb2.LoginResponse(
-                success=False,
-                error=str(e.message),
-                token_type="bearer",
-            )
+            return _login_error(str(e.message))
         except Exception as e:
-            logger.error(f"SSO exchange error: {e}")
-            return auth_pb2.LoginResponse(
-                success=False,
-                error="SSO exchange failed",
-                token_type="bearer",
-            )
+            logger.error("SSO exchange error: %s", e)
+            return _login_error("SSO exchange failed")
 
     async def Logout(
         self,
@@ -292,12 +340,14 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.LogoutResponse:
         """Logout user."""
-        logger.info(f"gRPC Logout called for user: {request.user_id}")
+        self._log_info("gRPC Logout called for user: %s", request.user_id)
 
         try:
-            async with await self._get_session() as session:
-                services = await self._create_services(session)
-                auth_service = services["auth_service"]
+            async with (
+                async_session_maker() as session,
+                self._services.checkout(session) as services,
+            ):
+                auth_service = services.auth_service
 
                 if request.global_: # type: ignore
                     await auth_service.logout_all(request.user_id)
@@ -320,7 +370,7 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                 )
 
         except Exception as e:
-            logger.error(f"Logout error: {e}")
+            logger.error("Logout error: %s", e)
             return auth_pb2.LogoutResponse(
                 success=False,
                 error=str(e),
@@ -333,17 +383,21 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> auth_pb2.GetSessionsResponse:
         """Get all sessions for a user."""
-        logger.info(f"gRPC GetSessions called for user: {request.user_id}")
+        self._log_info("gRPC GetSessions called for user: %s", request.user_id)
 
         try:
-            async with await self._get_session() as session:
-                services = await self._create_services(session)
-                session_service = services["session_service"]
+            async with (
+                async_session_maker() as session,
+                self._services.checkout(session) as services,
+            ):
+                session_service = services.session_service
 
                 all_sessions = await session_service.get_all_sessions(request.user_id)
 
                 proto_sessions = []
                 clients = set()
+                # Same device shape across a user's sessions -> one DeviceInfo build
+                device_infos = {}
 
                 for sess in all_sessions:
                     clients.add(sess.get("client_id", "unknown"))
@@ -359,7 +413,7 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                     proto_sessions.append(
                         auth_pb2.SessionInfo(
                             device_id=sess["device_id"],
-                            device_info=dict_to_device_info(sess.get("device_info")),
+                            device_info=dict_to_device_info(sess.get("device_info"), device_infos),
                             ip_address=sess.get("ip_address", ""),
                             client_id=sess.get("client_id", "unknown"),
                             created_at=created_at,
@@ -374,7 +428,7 @@ class AuthHandler(auth_pb2_grpc.AuthServiceServicer):
                 )
 
         except Exception as e:
-            logger.error(f"GetSessions error: {e}")
+            logger.error("GetSessions error: %s", e)
             return auth_pb2.GetSessionsResponse(
                 sessions=[],
                 total_clients=0,
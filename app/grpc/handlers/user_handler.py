@@ -1,120 +1,171 @@
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
+import uuid
+from typing import Optional, List, Iterable, AsyncIterator
 
 import grpc
 from google.protobuf.timestamp_pb2 import Timestamp
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
 
 from proto.sso import user_pb2, user_pb2_grpc
 from app.config.database import async_session_maker
 from app.modules.users.repositories import UserQueries, UserCommands
 from app.modules.auth.repositories import AuthProviderCommands
+from app.modules.applications.models import Application
+from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
 from app.modules.users.models import User
 from app.core.enums import UserRole, UserStatus, AuthProvider
 from app.core.security import PasswordService
 from app.grpc.utils import datetime_to_timestamp, generate_temp_password, get_grpc_error_message
 from app.grpc.converters import user_to_proto
-from app.core.exceptions import BadRequestException, NotFoundException
+from app.grpc.cache import get_cached_user_response, cache_user_response, publish_user_eviction
+from app.core.exceptions import BadRequestException
 
 logger = logging.getLogger(__name__)
 
+# Unknown or empty roles fall back to USER
+_ROLE_MAP = {role.value: role for role in UserRole}
+
 
 class UserHandler(user_pb2_grpc.UserServiceServicer):
 
-    async def _get_session(self) -> AsyncSession:
-        return async_session_maker()
+    async def _get_apps_by_codes(self, app_codes: Iterable[str]) -> List[Application]:
+        """Resolve app codes on their own session so the lookup can overlap other reads."""
+        app_codes = list(app_codes)
+        if not app_codes:
+            return []
+        async with async_session_maker() as session:
+            return await ApplicationQueries(session).get_by_codes(app_codes)
 
     async def GetUser(
         self,
         request: user_pb2.GetUserRequest,
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.UserResponse:
-        logger.info(f"gRPC GetUser called for user_id: {request.user_id}")
+        logger.info("gRPC GetUser called for user_id: %s", request.user_id)
 
-        try:
-            async with await self._get_session() as session:
-                user_queries = UserQueries(session)
-                user = await user_queries.get_by_id(request.user_id)
+        cached = get_cached_user_response("id", request.user_id)
+        if cached is not None:
+            return cached
 
-                if not user:
-                    return user_pb2.UserResponse(found=False)
+        async with async_session_maker() as session:
+            user_queries = UserQueries(session)
+            user = await user_queries.get_by_id(request.user_id)
 
-                return user_pb2.UserResponse(
-                    found=True,
-                    user=user_to_proto(user),
-                )
-        except Exception as e:
-            logger.error(f"gRPC GetUser failed: {e}", exc_info=True)
-            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+            if not user:
+                return user_pb2.UserResponse(found=False)
+
+            response = user_pb2.UserResponse(
+                found=True,
+                user=user_to_proto(user),
+            )
+            cache_user_response("id", request.user_id, response)
+            return response
 
     async def GetUserByEmail(
         self,
         request: user_pb2.GetUserByEmailRequest,
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.UserResponse:
-        logger.info(f"gRPC GetUserByEmail called for email: {request.email}")
+        logger.info("gRPC GetUserByEmail called for email: %s", request.email)
 
-        try:
-            async with await self._get_session() as session:
-                user_queries = UserQueries(session)
-                user = await user_queries.get_by_email(request.email)
+        cached = get_cached_user_response("email", request.email)
+        if cached is not None:
+            return cached
 
-                if not user:
-                    return user_pb2.UserResponse(found=False)
+        async with async_session_maker() as session:
+            user_queries = UserQueries(session)
+            user = await user_queries.get_by_email(request.email)
 
-                return user_pb2.UserResponse(
-                    found=True,
-                    user=user_to_proto(user),
-                )
-        except Exception as e:
-            logger.error(f"gRPC GetUserByEmail failed: {e}", exc_info=True)
-            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+            if not user:
+                return user_pb2.UserResponse(found=False)
+
+            response = user_pb2.UserResponse(
+                found=True,
+                user=user_to_proto(user),
+            )
+            cache_user_response("email", request.email, response)
+            return response
 
     async def GetUserByPhone(
         self,
         request: user_pb2.GetUserByPhoneRequest,
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.UserResponse:
-        logger.info(f"gRPC GetUserByPhone called for phone: {request.phone}")
+        logger.info("gRPC GetUserByPhone called for phone: %s", request.phone)
 
-        try:
-            async with await self._get_session() as session:
-                user_queries = UserQueries(session)
-                user = await user_queries.get_by_phone(request.phone)
+        cached = get_cached_user_response("phone", request.phone)
+        if cached is not None:
+            return cached
 
-                if not user:
-                    return user_pb2.UserResponse(found=False)
+        async with async_session_maker() as session:
+            user_queries = UserQueries(session)
+            user = await user_queries.get_by_phone(request.phone)
 
-                return user_pb2.UserResponse(
-                    found=True,
-                    user=user_to_proto(user),
-                )
-        except Exception as e:
-            logger.error(f"gRPC GetUserByPhone failed: {e}", exc_info=True)
-            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+            if not user:
+                return user_pb2.UserResponse(found=False)
+
+            response = user_pb2.UserResponse(
+                found=True,
+                user=user_to_proto(user),
+            )
+            cache_user_response("phone", request.phone, response)
+            return response
 
     async def BatchGetUsers(
         self,
         request: user_pb2.BatchGetUsersRequest,
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.BatchGetUsersResponse:
-        logger.info(f"gRPC BatchGetUsers called for {len(request.user_ids)} users")
+        logger.info("gRPC BatchGetUsers called for %s users", len(request.user_ids))
 
-        try:
-            users = []
-            async with await self._get_session() as session:
-                user_queries = UserQueries(session)
+        async with async_session_maker() as session:
+            user_queries = UserQueries(session)
+            found = await user_queries.get_by_ids(list(request.user_ids))
 
-                for user_id in request.user_ids:
-                    user = await user_queries.get_by_id(user_id)
-                    if user:
-                        users.append(user_to_proto(user))
+        # Keep the request order (and duplicates) like the per-ID lookup did
+        users_by_id = {str(user.id): user for user in found}
+        users = [
+            user_to_proto(users_by_id[user_id])
+            for user_id in request.user_ids
+            if user_id in users_by_id
+        ]
 
-            return user_pb2.BatchGetUsersResponse(users=users)
-        except Exception as e:
-            logger.error(f"gRPC BatchGetUsers failed: {e}", exc_info=True)
-            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+        return user_pb2.BatchGetUsersResponse(users=users)
+
+    async def StreamBatchGetUsers(
+        self,
+        request: user_pb2.BatchGetUsersRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[user_pb2.UserResponse]:
+        """Stream one UserResponse per requested id, encoding each only as it is sent."""
+        logger.info("gRPC StreamBatchGetUsers called for %s users", len(request.user_ids))
+
+        responses = {}
+        for user_id in request.user_ids:
+            cached = get_cached_user_response("id", user_id)
+            if cached is not None:
+                responses[user_id] = cached
+        missing = [user_id for user_id in set(request.user_ids) if user_id not in responses]
+
+        users_by_id = {}
+        if missing:
+            async with async_session_maker() as session:
+                found = await UserQueries(session).get_by_ids(missing)
+            users_by_id = {str(user.id): user for user in found}
+
+        for user_id in request.user_ids:
+            response = responses.get(user_id)
+            if response is None:
+                user = users_by_id.get(user_id)
+                if user is None:
+                    response = user_pb2.UserResponse(found=False)
+                else:
+                    response = user_pb2.UserResponse(found=True, user=user_to_proto(user))
+                    cache_user_response("id", user_id, response)
+                responses[user_id] = response
+            yield response
 
     async def CreateUser(
         self,
@@ -122,88 +173,164 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.CreateUserResponse:
         """Create user with optional email/password auth provider and assign to apps."""
-        logger.info(f"gRPC CreateUser called for email: {request.email}, apps: {list(request.app_codes)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("gRPC CreateUser called for email: %s, apps: %s", request.email, list(request.app_codes))
 
-        async with await self._get_session() as session:
-            try:
-                user_queries = UserQueries(session)
-                user_commands = UserCommands(session)
-                auth_commands = AuthProviderCommands(session)
-
-                existing = await user_queries.get_by_email(request.email)
-                if existing:
-                    return user_pb2.CreateUserResponse(
-                        success=False,
-                        error=f"Email {request.email} sudah terdaftar"
-                    )
+        role = _ROLE_MAP.get(request.role, UserRole.USER)
 
-                role = UserRole.USER
-                if request.role:
-                    try:
-                        role = UserRole(request.role)
-                    except ValueError:
-                        role = UserRole.USER
+        temp_password = None
+        if request.password:
+            password = request.password
+        else:
+            password = generate_temp_password()
+            temp_password = password
 
-                user = await user_commands.create(
+        try:
+            password_hash, apps = await asyncio.gather(
+                PasswordService.hash_password_async(password),
+                self._get_apps_by_codes(request.app_codes),
+            )
+            app_ids = [str(app.id) for app in apps]
+            for app_code in set(request.app_codes) - {app.code for app in apps}:
+                logger.warning("Application code '%s' not found, skipping", app_code)
+
+            # Email uniqueness is enforced by the users.email unique index (IntegrityError below)
+            async with async_session_maker() as session, session.begin():
+                user = await UserCommands(session).create(
                     name=request.name,
                     email=request.email,
                     phone=request.phone if request.phone else None,
                     role=role,
                     status=UserStatus.ACTIVE,
                 )
+                await AuthProviderCommands(session).bulk_create([{
+                    "user_id": user.id,
+                    "provider": AuthProvider.EMAIL.value,
+                    "provider_user_id": request.email,
+                    "password_hash": password_hash,
+                }])
+                if app_ids:
+                    await ApplicationCommands(session).bulk_add_user_applications(
+                        [{"user_id": user.id, "application_id": app_id} for app_id in app_ids]
+                    )
+                    logger.info("Assigned user %s to %s applications", user.id, len(app_ids))
+
+            logger.info("User created via gRPC: %s", user.id)
+            return user_pb2.CreateUserResponse(
+                success=True,
+                user=user_to_proto(user),
+                temporary_password=temp_password,
+            )
+
+        except BadRequestException as e:
+            return user_pb2.CreateUserResponse(
+                success=False,
+                error=str(e)
+            )
+        except Exception as e:
+            error_msg = get_grpc_error_message(e, "Terjadi kesalahan saat membuat user")
+            logger.warning("CreateUser failed: %s", error_msg)
+            return user_pb2.CreateUserResponse(success=False, error=error_msg)
 
-                temp_password = None
-                if request.password:
-                    password = request.password
-                else:
-                    password = generate_temp_password()
-                    temp_password = password
-
-                password_hash = PasswordService.hash_password(password)
-                await auth_commands.create(
-                    user_id=user.id,
-                    provider=AuthProvider.EMAIL.value,
-                    provider_user_id=request.email,
-                    password_hash=password_hash,
+    async def BatchCreateUsers(
+        self,
+        request_iterator: AsyncIterator[user_pb2.CreateUserRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[user_pb2.CreateUserResponse]:
+        """Create a stream of users in one transaction, replying once per request in order."""
+        requests = [request async for request in request_iterator]
+        logger.info("gRPC BatchCreateUsers called for %s users", len(requests))
+        if not requests:
+            return
+
+        responses: List[Optional[user_pb2.CreateUserResponse]] = [None] * len(requests)
+
+        async with async_session_maker() as session:
+            try:
+                all_codes = {code for request in requests for code in request.app_codes}
+                taken, apps = await asyncio.gather(
+                    UserQueries(session).get_existing_emails([r.email for r in requests]),
+                    self._get_apps_by_codes(all_codes),
                 )
-                
-                if request.app_codes:
-                    from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
-                    app_queries = ApplicationQueries(session)
-                    app_commands = ApplicationCommands(session)
-                    
-                    app_ids = []
-                    for app_code in request.app_codes:
-                        app = await app_queries.get_by_code(app_code)
-                        if app:
-                            app_ids.append(str(app.id))
-                        else:
-                            logger.warning(f"Application code '{app_code}' not found, skipping")
-                    
-                    if app_ids:
-                        await app_commands.assign_applications_to_user(str(user.id), app_ids)
-                        logger.info(f"Assigned user {user.id} to {len(app_ids)} applications")
+                app_ids_by_code = {app.code: str(app.id) for app in apps}
+                for app_code in all_codes - app_ids_by_code.keys():
+                    logger.warning("Application code '%s' not found, skipping", app_code)
+
+                pending = []  # (index, request, temporary_password)
+                user_rows = []
+                provider_rows = []
+                passwords = []
+                for index, request in enumerate(requests):
+                    if request.email in taken:
+                        responses[index] = user_pb2.CreateUserResponse(
+                            success=False,
+                            error=f"Email {request.email} sudah terdaftar",
+                        )
+                        continue
+                    taken.add(request.email)
+
+                    role = _ROLE_MAP.get(request.role, UserRole.USER)
+
+                    temp_password = None
+                    if request.password:
+                        password = request.password
+                    else:
+                        password = generate_temp_password()
+                        temp_password = password
+
+                    user_id = uuid.uuid4()
+                    user_rows.append({
+                        "id": user_id,
+                        "name": request.name,
+                        "email": request.email,
+                        "phone": request.phone if request.phone else None,
+                        "role": role.value,
+                        "status": UserStatus.ACTIVE.value,
+                    })
+                    provider_rows.append({
+                        "user_id": user_id,
+                        "provider": AuthProvider.EMAIL.value,
+                        "provider_user_id": request.email,
+                    })
+                    passwords.append(password)
+                    pending.append((index, request, temp_password))
+
+                hashes = await asyncio.gather(
+                    *(PasswordService.hash_password_async(password) for password in passwords)
+                )
+                for row, password_hash in zip(provider_rows, hashes):
+                    row["password_hash"] = password_hash
+
+                users = await UserCommands(session).bulk_create(user_rows)
+                await AuthProviderCommands(session).bulk_create(provider_rows)
+                await ApplicationCommands(session).bulk_add_user_applications([
+                    {"user_id": user.id, "application_id": app_ids_by_code[code]}
+                    for user, (_, request, _) in zip(users, pending)
+                    for code in set(request.app_codes)
+                    if code in app_ids_by_code
+                ])
 
                 await session.commit()
-                logger.info(f"User created via gRPC: {user.id}")
+                logger.info("Batch created %s users via gRPC", len(users))
 
-                return user_pb2.CreateUserResponse(
-                    success=True,
-                    user=user_to_proto(user),
-                    temporary_password=temp_password,
-                )
+                for user, (index, _, temp_password) in zip(users, pending):
+                    responses[index] = user_pb2.CreateUserResponse(
+                        success=True,
+                        user=user_to_proto(user),
+                        temporary_password=temp_password,
+                    )
 
-            except BadRequestException as e:
-                await session.rollback()
-                return user_pb2.CreateUserResponse(
-                    success=False,
-                    error=str(e)
-                )
             except Exception as e:
                 await session.rollback()
                 error_msg = get_grpc_error_message(e, "Terjadi kesalahan saat membuat user")
-                logger.warning(f"CreateUser failed: {error_msg}")
-                return user_pb2.CreateUserResponse(success=False, error=error_msg)
+                logger.warning("BatchCreateUsers failed: %s", error_msg)
+                responses = [
+                    response or user_pb2.CreateUserResponse(success=False, error=error_msg)
+                    for response in responses
+                ]
+
+        for response in responses:
+            yield response
 
     async def UpdateUser(
         self,
@@ -211,53 +338,58 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.UpdateUserResponse:
         """Update user profile. Also handles restore by setting status=active."""
-        logger.info(f"gRPC UpdateUser called for user_id: {request.user_id}")
+        logger.info("gRPC UpdateUser called for user_id: %s", request.user_id)
 
-        async with await self._get_session() as session:
+        async with async_session_maker() as session:
             try:
-                from sqlalchemy import select
-                
-                stmt = select(User).where(User.id == request.user_id)
+                values = {}
+                if request.name:
+                    values["name"] = request.name
+                if request.email:
+                    values["email"] = request.email
+                if request.phone:
+                    values["phone"] = request.phone
+                if request.role:
+                    values["role"] = request.role
+                if request.status:
+                    values["status"] = request.status
+                    if request.status.lower() == "active":
+                        values["deleted_at"] = None
+
+                # Single UPDATE ... RETURNING instead of SELECT + mutate + flush + refresh
+                if values:
+                    stmt = (
+                        update(User)
+                        .where(User.id == request.user_id)
+                        .values(**values)
+                        .returning(User)
+                    )
+                else:
+                    stmt = select(User).where(User.id == request.user_id)
                 result = await session.execute(stmt)
                 user = result.scalar_one_or_none()
-                
+
                 if not user:
+                    await session.rollback()
                     return user_pb2.UpdateUserResponse(
                         success=False,
                         error=f"User {request.user_id} tidak ditemukan"
                     )
 
-                if request.name:
-                    user.name = request.name
-                if request.email:
-                    user.email = request.email
-                if request.phone:
-                    user.phone = request.phone
-                if request.role:
-                    user.role = request.role
-                if request.status:
-                    user.status = request.status
-                    if request.status.lower() == "active":
-                        user.deleted_at = None
-                        logger.info(f"Restoring user {request.user_id} - clearing deleted_at")
+                if "deleted_at" in values:
+                    logger.info("Restoring user %s - clearing deleted_at", request.user_id)
 
-                await session.flush()
+                # expire_on_commit=False keeps the RETURNING-loaded attributes readable; no refresh needed
                 await session.commit()
-                await session.refresh(user)
+                await publish_user_eviction(str(user.id))
 
-                logger.info(f"User updated via gRPC: {user.id}")
+                logger.info("User updated via gRPC: %s", user.id)
 
                 return user_pb2.UpdateUserResponse(
                     success=True,
                     user=user_to_proto(user),
                 )
 
-            except NotFoundException as e:
-                await session.rollback()
-                return user_pb2.UpdateUserResponse(
-                    success=False,
-                    error=str(e)
-                )
             except BadRequestException as e:
                 await session.rollback()
                 return user_pb2.UpdateUserResponse(
@@ -267,7 +399,7 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
             except Exception as e:
                 await session.rollback()
                 error_msg = get_grpc_error_message(e, "Terjadi kesalahan saat memperbarui user")
-                logger.warning(f"UpdateUser failed: {error_msg}")
+                logger.warning("UpdateUser failed: %s", error_msg)
                 return user_pb2.UpdateUserResponse(success=False, error=error_msg)
 
     async def RemoveUserFromApps(
@@ -276,34 +408,29 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.RemoveUserFromAppsResponse:
         """Remove user from specific applications (app-specific delete)."""
-        logger.info(f"gRPC RemoveUserFromApps called for user_id: {request.user_id}, apps: {list(request.app_codes)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("gRPC RemoveUserFromApps called for user_id: %s, apps: %s", request.user_id, list(request.app_codes))
 
-        async with await self._get_session() as session:
+        async with async_session_maker() as session:
             try:
-                from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
-                
-                app_queries = ApplicationQueries(session)
-                app_commands = ApplicationCommands(session)
-                
-                for app_code in request.app_codes:
-                    app = await app_queries.get_by_code(app_code)
-                    if app:
-                        await app_commands.remove_application_from_user(request.user_id, str(app.id))
-                        logger.info(f"Removed user {request.user_id} from app {app_code}")
-                
-                remaining_apps = await app_queries.get_user_applications(request.user_id)
-                remaining_count = len(remaining_apps)
-                
-                if remaining_count == 0:
-                    user_queries = UserQueries(session)
-                    user_commands = UserCommands(session)
-                    user = await user_queries.get_by_id(request.user_id)
-                    if user and user.deleted_at is None:
-                        await user_commands.delete(user)
-                        logger.info(f"User {request.user_id} soft-deleted (no apps remaining)")
-                
+                removed = await ApplicationCommands(session).remove_applications_from_user_by_codes(
+                    request.user_id, list(request.app_codes)
+                )
+                if removed:
+                    logger.info("Removed user %s from %s apps", request.user_id, removed)
+
+                # Guarded UPDATE soft-deletes only when no apps remain; count only if it did not
+                soft_deleted = await UserCommands(session).soft_delete_if_no_applications(request.user_id)
+                if soft_deleted:
+                    remaining_count = 0
+                    logger.info("User %s soft-deleted (no apps remaining)", request.user_id)
+                else:
+                    remaining_count = await ApplicationQueries(session).count_user_applications(request.user_id)
+
                 await session.commit()
-                logger.info(f"User {request.user_id} removed from apps, remaining: {remaining_count}")
+                if soft_deleted:
+                    await publish_user_eviction(request.user_id)
+                logger.info("User %s removed from apps, remaining: %s", request.user_id, remaining_count)
 
                 return user_pb2.RemoveUserFromAppsResponse(
                     success=True,
@@ -312,7 +439,7 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
 
             except Exception as e:
                 await session.rollback()
-                logger.error(f"Failed to remove user from apps: {e}", exc_info=True)
+                logger.error("Failed to remove user from apps: %s", e, exc_info=True)
                 return user_pb2.RemoveUserFromAppsResponse(
                     success=False,
                     error=str(e),
@@ -325,33 +452,28 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> user_pb2.AssignUserToAppsResponse:
         """Assign user to specific applications (for restore or new assignment)."""
-        logger.info(f"gRPC AssignUserToApps called for user_id: {request.user_id}, apps: {list(request.app_codes)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("gRPC AssignUserToApps called for user_id: %s, apps: %s", request.user_id, list(request.app_codes))
 
-        async with await self._get_session() as session:
+        async with async_session_maker() as session:
             try:
-                from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
-                
-                app_queries = ApplicationQueries(session)
-                app_commands = ApplicationCommands(session)
+                user_queries = UserQueries(session)
                 
-                app_ids = []
-                for app_code in request.app_codes:
-                    app = await app_queries.get_by_code(app_code)
-                    if app:
-                        app_ids.append(str(app.id))
-                    else:
-                        logger.warning(f"Application code '{app_code}' not found, skipping")
+                apps, user = await asyncio.gather(
+                    self._get_apps_by_codes(request.app_codes),
+                    user_queries.get_by_id_include_deleted(request.user_id),
+                )
+                app_ids = [str(app.id) for app in apps]
+                for app_code in set(request.app_codes) - {app.code for app in apps}:
+                    logger.warning("Application code '%s' not found, skipping", app_code)
                 
                 if app_ids:
-                    await app_commands.assign_applications_to_user(request.user_id, app_ids)
-                    logger.info(f"Assigned user {request.user_id} to {len(app_ids)} applications")
+                    await ApplicationCommands(session).assign_applications_to_user(request.user_id, app_ids)
+                    logger.info("Assigned user %s to %s applications", request.user_id, len(app_ids))
                     
-                    user_queries = UserQueries(session)
-                    user_commands = UserCommands(session)
-                    user = await user_queries.get_by_id_include_deleted(request.user_id)
                     if user and user.deleted_at is not None:
-                        await user_commands.restore(user)
-                        logger.info(f"User {request.user_id} restored (apps assigned)")
+                        await UserCommands(session).restore(user)
+                        logger.info("User %s restored (apps assigned)", request.user_id)
 
                 await session.commit()
 
@@ -359,7 +481,7 @@ class UserHandler(user_pb2_grpc.UserServiceServicer):
 
             except Exception as e:
                 await session.rollback()
-                logger.error(f"Failed to assign user to apps: {e}", exc_info=True)
+                logger.error("Failed to assign user to apps: %s", e, exc_info=True)
                 return user_pb2.AssignUserToAppsResponse(
                     success=False,
                     error=str(e)
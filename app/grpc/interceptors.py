@@ -0,0 +1,116 @@
+"""
+gRPC Server Interceptors
+
+Central exception-to-status mapping so handlers don't each wrap their body in try/except.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import grpc
+from grpc.aio import AbortError
+
+from app.core.exceptions import (
+    AppException,
+    BadRequestException,
+    ValidationException,
+    UnauthorizedException,
+    ForbiddenException,
+    NotFoundException,
+    ConflictException,
+)
+
+logger = logging.getLogger(__name__)
+
+_STATUS_BY_EXCEPTION = {
+    BadRequestException: grpc.StatusCode.INVALID_ARGUMENT,
+    ValidationException: grpc.StatusCode.INVALID_ARGUMENT,
+    UnauthorizedException: grpc.StatusCode.UNAUTHENTICATED,
+    ForbiddenException: grpc.StatusCode.PERMISSION_DENIED,
+    NotFoundException: grpc.StatusCode.NOT_FOUND,
+    ConflictException: grpc.StatusCode.ALREADY_EXISTS,
+}
+
+
+def _status_for(error: Exception) -> grpc.StatusCode:
+    if isinstance(error, AppException):
+        for cls in type(error).__mro__:
+            status = _STATUS_BY_EXCEPTION.get(cls)
+            if status is not None:
+                return status
+    return grpc.StatusCode.INTERNAL
+
+
+async def _abort(method: str, error: Exception, context: grpc.aio.ServicerContext) -> None:
+    code = _status_for(error)
+    if code is grpc.StatusCode.INTERNAL:
+        logger.error("gRPC %s failed: %s", method, error, exc_info=True)
+    else:
+        logger.warning("gRPC %s rejected: %s", method, error)
+    await context.abort(code, str(error))
+
+
+class ErrorInterceptor(grpc.aio.ServerInterceptor):
+    """Turn exceptions escaping a handler into a gRPC status (INTERNAL unless mapped)."""
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._wrap_unary(method, handler.unary_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                self._wrap_unary(method, handler.stream_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._wrap_stream(method, handler.unary_stream),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.stream_stream:
+            return grpc.stream_stream_rpc_method_handler(
+                self._wrap_stream(method, handler.stream_stream),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+    @staticmethod
+    def _wrap_unary(method: str, behavior: Callable[..., Awaitable[Any]]):
+        async def wrapper(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            try:
+                return await behavior(request, context)
+            except AbortError:
+                raise
+            except Exception as e:
+                await _abort(method, e, context)
+
+        return wrapper
+
+    @staticmethod
+    def _wrap_stream(method: str, behavior: Callable[..., AsyncIterator[Any]]):
+        async def wrapper(request: Any, context: grpc.aio.ServicerContext) -> AsyncIterator[Any]:
+            try:
+                async for response in behavior(request, context):
+                    yield response
+            except AbortError:
+                raise
+            except Exception as e:
+                await _abort(method, e, context)
+
+        return wrapper
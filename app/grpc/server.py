@@ -4,26 +4,74 @@ gRPC Server for SSO Backend
 Runs gRPC server alongside FastAPI for inter-service communication.
 """
 
+import asyncio
 import logging
-from typing import Optional
+import multiprocessing
+import signal
+from typing import List, Optional
 
 import grpc
+from google.protobuf.internal import api_implementation
 from grpc.aio import Server
 
 from app.config.settings import settings
+from app.config.database import warm_up_pool
 from proto.sso import user_pb2_grpc, auth_pb2_grpc
 from app.grpc.handlers.auth_handler import AuthHandler
 from app.grpc.handlers.user_handler import UserHandler
+from app.grpc.interceptors import ErrorInterceptor
+from app.grpc.cache import run_user_eviction_listener
 
 logger = logging.getLogger(__name__)
 
+# Seconds in-flight RPCs get to finish on shutdown (main server and workers alike)
+_STOP_GRACE = 5
+
+
+def _run_worker(port: int) -> None:
+    """Entry point of an extra gRPC worker process; shares the port via SO_REUSEPORT."""
+    from app.core.utils.logging import setup_logging
+    from app.core.security.firebase import FirebaseService
+
+    setup_logging()
+    if settings.FIREBASE_PROJECT_ID:
+        try:
+            FirebaseService.initialize()
+        except Exception as e:
+            logger.warning(f"Firebase initialization skipped in gRPC worker: {e}")
+
+    async def serve() -> None:
+        server = GRPCServer(port=port)
+        await server.start()
+
+        # The parent stops workers with SIGTERM; drain in-flight RPCs instead of dying mid-call.
+        # SIGINT too, since Ctrl+C reaches the whole process group
+        loop = asyncio.get_running_loop()
+        stopping: List[asyncio.Task] = []
+
+        def _stop() -> None:
+            if not stopping:
+                stopping.append(loop.create_task(server.stop()))
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, _stop)
+
+        await server.wait_for_termination()
+        if stopping:
+            await stopping[0]
+
+    asyncio.run(serve())
+
 
 class GRPCServer:
     """Async gRPC server manager."""
     
-    def __init__(self, port: int = 50051):
+    def __init__(self, port: int = 50051, worker_count: int = 1):
         self.port = port
+        self.worker_count = max(1, worker_count)
         self._server: Optional[Server] = None
+        self._workers: List[multiprocessing.Process] = []
+        self._eviction_listener: Optional[asyncio.Task] = None
     
     async def start(self) -> None:
         """Start the gRPC server."""
@@ -31,8 +79,20 @@ class GRPCServer:
         options = [
             ('grpc.max_send_message_length', max_msg_size),
             ('grpc.max_receive_message_length', max_msg_size),
+            ('grpc.http2.write_buffer_size', 64 * 1024),
+            ('grpc.http2.max_frame_size', 16384),
+            ('grpc.keepalive_time_ms', 30000),
+            ('grpc.keepalive_timeout_ms', 10000),
+            ('grpc.so_reuseport', 1),
         ]
-        self._server = grpc.aio.server(options=options)
+        compression = (
+            grpc.Compression.Gzip if settings.GRPC_ENABLE_COMPRESSION else grpc.Compression.NoCompression
+        )
+        self._server = grpc.aio.server(
+            interceptors=[ErrorInterceptor()],
+            options=options,
+            compression=compression,
+        )
         
         # Register handlers
         auth_pb2_grpc.add_AuthServiceServicer_to_server(AuthHandler(), self._server)
@@ -42,14 +102,42 @@ class GRPCServer:
         listen_addr = f"[::]:{self.port}"
         self._server.add_insecure_port(listen_addr)
         
+        if api_implementation.Type() == "python":
+            logger.warning("protobuf is running the pure-Python implementation; gRPC (de)serialization will be slow")
+        await warm_up_pool()
         await self._server.start()
+        # Each process keeps its own response cache; evictions from other processes arrive here
+        self._eviction_listener = asyncio.create_task(run_user_eviction_listener())
         logger.info(f"gRPC server started on port {self.port}")
+
+        # Extra processes, each with its own event loop; the kernel spreads connections
+        ctx = multiprocessing.get_context("spawn")
+        for _ in range(self.worker_count - 1):
+            worker = ctx.Process(target=_run_worker, args=(self.port,), daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        if self._workers:
+            logger.info(f"Started {len(self._workers)} additional gRPC worker processes")
     
     async def stop(self) -> None:
         """Stop the gRPC server gracefully."""
+        # SIGTERM lets each worker drain for _STOP_GRACE; kill the ones that overrun it
+        for worker in self._workers:
+            worker.terminate()
+        for worker in self._workers:
+            await asyncio.to_thread(worker.join, _STOP_GRACE + 2)
+            if worker.is_alive():
+                logger.warning(f"gRPC worker {worker.pid} did not stop in time; killing it")
+                worker.kill()
+        self._workers.clear()
+
         if self._server:
-            await self._server.stop(grace=5)
+            await self._server.stop(grace=_STOP_GRACE)
             logger.info("gRPC server stopped")
+
+        if self._eviction_listener:
+            self._eviction_listener.cancel()
+            self._eviction_listener = None
     
     async def wait_for_termination(self) -> None:
         """Wait for server to terminate."""
@@ -58,4 +146,7 @@ class GRPCServer:
 
 
 # Global server instance
-grpc_server = GRPCServer(port=getattr(settings, 'GRPC_PORT', 50051))
+grpc_server = GRPCServer(
+    port=getattr(settings, 'GRPC_PORT', 50051),
+    worker_count=settings.GRPC_WORKERS,
+)
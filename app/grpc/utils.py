@@ -4,62 +4,164 @@ gRPC Utility Functions for SSO Backend
 Shared helpers for gRPC handlers.
 """
 
+import hashlib
+import re
 import secrets
 import string
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 from google.protobuf.timestamp_pb2 import Timestamp
 from proto.sso import auth_pb2
 
 
+@dataclass(frozen=True, slots=True)
+class TokenCtx:
+    """Incoming bearer token, encoded and digested once per RPC."""
+
+    raw: bytes
+    digest: bytes
+
+    @classmethod
+    def from_token(cls, token: str) -> "TokenCtx":
+        raw = token.encode("utf-8")
+        return cls(raw=raw, digest=hashlib.blake2b(raw, digest_size=16).digest())
+
+
 def datetime_to_timestamp(dt: Optional[datetime]) -> Optional[Timestamp]:
     """Convert datetime to protobuf Timestamp."""
     if dt is None:
         return None
-    timestamp = Timestamp()
-    timestamp.FromDatetime(dt)
-    return timestamp
+    # Naive datetimes are UTC, matching Timestamp.FromDatetime
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    # nanos from the exact microsecond field rather than float arithmetic on dt.timestamp()
+    return Timestamp(seconds=int(dt.timestamp()), nanos=dt.microsecond * 1000)
+
+
+_DEVICE_INFO_FIELDS = tuple(auth_pb2.DeviceInfo.DESCRIPTOR.fields_by_name)
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceInfoLite:
+    """Plain-attribute copy of DeviceInfo; field names match the proto."""
+
+    platform: str = ""
+    device_name: str = ""
+    os_version: str = ""
+    app_version: str = ""
+    extra: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_proto(cls, device_info: auth_pb2.DeviceInfo) -> "DeviceInfoLite":
+        return cls(
+            platform=device_info.platform,
+            device_name=device_info.device_name,
+            os_version=device_info.os_version,
+            app_version=device_info.app_version,
+            extra=dict(device_info.extra) or None,
+        )
+
+    def as_dict(self) -> Optional[Dict[str, Any]]:
+        """Sparse dict for session storage: empty fields are left out."""
+        result = {}
+        for key in _DEVICE_INFO_FIELDS:
+            value = getattr(self, key)
+            if value:
+                result[key] = value
+        return result or None
 
 
 def device_info_to_dict(device_info: auth_pb2.DeviceInfo) -> Optional[Dict[str, Any]]:
     """Convert protobuf DeviceInfo to dict."""
-    if not device_info:
+    # ListFields is a native call; skips the field reads for sent-but-empty messages
+    if not device_info or not device_info.ListFields():
         return None
-    
-    result = {}
-    if device_info.platform:
-        result["platform"] = device_info.platform
-    if device_info.device_name:
-        result["device_name"] = device_info.device_name
-    if device_info.os_version:
-        result["os_version"] = device_info.os_version
-    if device_info.app_version:
-        result["app_version"] = device_info.app_version
-    if device_info.extra:
-        result["extra"] = dict(device_info.extra)
-    
-    return result if result else None
+
+    # Direct field reads instead of the pure-Python json_format walk; optional fields keep
+    # presence, so explicitly-sent empty strings are dropped by as_dict()
+    return DeviceInfoLite.from_proto(device_info).as_dict()
 
 
-def dict_to_device_info(data: Optional[Dict[str, Any]]) -> Optional[auth_pb2.DeviceInfo]:
-    """Convert dict to protobuf DeviceInfo."""
+def device_info_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """DeviceInfo constructor kwargs from a session device_info dict."""
+    # Session device_info comes from REST clients too; keys outside DeviceInfo are ignored,
+    # and empty values stay unset so optional fields are not put on the wire as ""
+    return {key: data[key] for key in _DEVICE_INFO_FIELDS if data.get(key)}
+
+
+def dict_to_device_info(
+    data: Optional[Dict[str, Any]],
+    memo: Optional[Dict[tuple, auth_pb2.DeviceInfo]] = None,
+) -> Optional[auth_pb2.DeviceInfo]:
+    """Convert dict to protobuf DeviceInfo.
+
+    ``memo`` (a dict owned by the caller) reuses one message per distinct device shape
+    within a batch. Only pass it when the result goes straight into a parent message
+    constructor, which copies it.
+    """
     if not data:
         return None
-    
-    return auth_pb2.DeviceInfo(
-        platform=data.get("platform", ""),
-        device_name=data.get("device_name", ""),
-        os_version=data.get("os_version", ""),
-        app_version=data.get("app_version", ""),
-        extra=data.get("extra", {}),
+
+    kwargs = device_info_kwargs(data)
+    if memo is None:
+        return auth_pb2.DeviceInfo(**kwargs)
+
+    key = tuple(
+        (name, frozenset(value.items()) if isinstance(value, dict) else value)
+        for name, value in kwargs.items()
     )
+    message = memo.get(key)
+    if message is None:
+        message = memo[key] = auth_pb2.DeviceInfo(**kwargs)
+    return message
+
+
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+_PASSWORD_ALPHABET_SIZE = len(_PASSWORD_ALPHABET)
+# Largest multiple of the alphabet size below 256 (248); higher bytes are rejected to avoid modulo bias
+_PASSWORD_BYTE_LIMIT = 256 - 256 % _PASSWORD_ALPHABET_SIZE
 
 
 def generate_temp_password(length: int = 12) -> str:
     """Generate a secure temporary password."""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    chars: list[str] = []
+    while len(chars) < length:
+        # One urandom read per round instead of one secrets.choice() per character
+        chars.extend(
+            _PASSWORD_ALPHABET[b % _PASSWORD_ALPHABET_SIZE]
+            for b in secrets.token_bytes(length * 2)
+            if b < _PASSWORD_BYTE_LIMIT
+        )
+    return ''.join(chars[:length])
+
+
+# Keywords looked for in DB error strings -> facts they imply. Longer keywords come first
+# so a shared prefix ("foreign key" / "foreign", "application" / "app") maps to the richer set.
+_ERROR_TOKENS = {
+    "uniqueviolationerror": ("unique",),
+    "unique constraint": ("unique",),
+    "foreignkeyviolationerror": ("foreign_key", "foreign"),
+    "foreign key": ("foreign_key", "foreign"),
+    "foreign": ("foreign",),
+    "notnullviolationerror": ("not_null",),
+    "not-null": ("not_null",),
+    "checkviolationerror": ("check",),
+    "check constraint": ("check",),
+    "users_email_key": ("email_key", "email"),
+    "email": ("email",),
+    "phone": ("phone",),
+    "username": ("username",),
+    "user_id": ("user_id",),
+    "role": ("role",),
+    "application": ("application",),
+    "app": ("application",),
+}
+# Zero-width lookahead so overlapping keywords ("users_email_key" -> "email") are all found in one scan
+_ERROR_TOKEN_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(token) for token in _ERROR_TOKENS) + "))"
+)
 
 
 def get_grpc_error_message(error: Exception, fallback_message: str) -> str:
@@ -76,36 +178,37 @@ def get_grpc_error_message(error: Exception, fallback_message: str) -> str:
     Returns:
         User-friendly error message in Indonesian
     """
-    error_str = str(error)
-    
+    found = set()
+    for token in _ERROR_TOKEN_PATTERN.findall(str(error).lower()):
+        found.update(_ERROR_TOKENS[token])
+
     # Unique constraint violations
-    if "UniqueViolationError" in error_str or "unique constraint" in error_str.lower():
-        if "users_email_key" in error_str or ("email" in error_str.lower() and "foreign" not in error_str.lower()):
+    if "unique" in found:
+        if "email_key" in found or ("email" in found and "foreign" not in found):
             return "Email sudah terdaftar"
-        elif "users_phone_key" in error_str or "phone" in error_str.lower():
+        elif "phone" in found:
             return "Nomor telepon sudah terdaftar"
-        elif "users_username_key" in error_str or "username" in error_str.lower():
+        elif "username" in found:
             return "Username sudah digunakan"
         else:
             return "Data sudah ada dalam sistem"
-    
+
     # Foreign key violations
-    if "ForeignKeyViolationError" in error_str or "foreign key" in error_str.lower():
-        if "user_id" in error_str.lower():
+    if "foreign_key" in found:
+        if "user_id" in found:
             return "User tidak ditemukan"
-        elif "role" in error_str.lower():
+        elif "role" in found:
             return "Role tidak ditemukan"
-        elif "application" in error_str.lower() or "app" in error_str.lower():
+        elif "application" in found:
             return "Aplikasi tidak ditemukan"
         return "Data terkait tidak ditemukan"
-    
+
     # Not null violations
-    if "NotNullViolationError" in error_str or "not-null" in error_str.lower():
+    if "not_null" in found:
         return "Data wajib tidak boleh kosong"
-    
-    # Check constraint violations  
-    if "CheckViolationError" in error_str or "check constraint" in error_str.lower():
+
+    # Check constraint violations
+    if "check" in found:
         return "Data tidak valid"
-    
-    return fallback_message
 
+    return fallback_message
@@ -2,7 +2,14 @@
 FastAPI Application Entry Point
 """
 
+import os
+
+# Native (upb) protobuf runtime for the gRPC bindings; must be set before any *_pb2 import.
+# Inherited by spawned gRPC worker processes.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.config.settings import settings
 from app.core.utils.logging import setup_logging
 from app.core.utils.lifespan import lifespan
@@ -20,6 +27,7 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Setup middleware
@@ -7,30 +7,21 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_db
-from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
+from app.modules.applications.repositories import ApplicationRepository
 
 from app.modules.applications.services.application_service import ApplicationService
 
 
-def get_app_queries(db: AsyncSession = Depends(get_db)) -> ApplicationQueries:
-    return ApplicationQueries(db)
+async def get_app_repository(db: AsyncSession = Depends(get_db)) -> ApplicationRepository:
+    return ApplicationRepository(db)
 
 
-ApplicationQueriesDep = Annotated[ApplicationQueries, Depends(get_app_queries)]
+ApplicationRepositoryDep = Annotated[ApplicationRepository, Depends(get_app_repository)]
 
 
-def get_app_commands(db: AsyncSession = Depends(get_db)) -> ApplicationCommands:
-    return ApplicationCommands(db)
-
-
-ApplicationCommandsDep = Annotated[ApplicationCommands, Depends(get_app_commands)]
-
-
-def get_application_service(
-    queries: ApplicationQueriesDep,
-    commands: ApplicationCommandsDep,
-) -> ApplicationService:
-    return ApplicationService(queries, commands)
+async def get_application_service(repository: ApplicationRepositoryDep) -> ApplicationService:
+    # One repository object serves as both the queries and the commands side
+    return ApplicationService(repository, repository)
 
 
 ApplicationServiceDep = Annotated[ApplicationService, Depends(get_application_service)]
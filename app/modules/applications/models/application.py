@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, DateTime, Text, Boolean, func
+from sqlalchemy import String, DateTime, Text, Boolean, Index, event, func, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, with_loader_criteria
 
 from app.config.database import Base
 
@@ -13,16 +13,35 @@ if TYPE_CHECKING:
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Unique among live rows only; every SELECT filters deleted_at IS NULL and
+        # a soft-deleted app's code/name can be reused
+        Index(
+            "ix_applications_code_active",
+            "code",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_applications_name_active",
+            "name",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Admin listing: filter deleted_at/is_active, ORDER BY created_at DESC LIMIT n
+        Index(
+            "ix_applications_listing",
+            "deleted_at",
+            "is_active",
+            text("created_at DESC"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    name: Mapped[str] = mapped_column(
-        String(255), unique=True, nullable=False, index=True
-    )
-    code: Mapped[str] = mapped_column(
-        String(100), unique=True, nullable=False, index=True
-    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    code: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     base_url: Mapped[str] = mapped_column(String(500), nullable=False)
     img_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -53,3 +72,25 @@ class Application(Base):
 
     def __repr__(self) -> str:
         return f"<Application(id={self.id}, code={self.code}, name={self.name})>"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_deleted_applications(execute_state) -> None:
+    """Add `deleted_at IS NULL` for Application to every ORM SELECT.
+
+    Applies to joins and to relationship loads (e.g. User.applications) too.
+    Pass execution_options(include_deleted=True) to opt out.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                Application,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
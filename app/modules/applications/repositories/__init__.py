@@ -1,4 +1,5 @@
 from app.modules.applications.repositories.queries import ApplicationQueries
 from app.modules.applications.repositories.commands import ApplicationCommands
+from app.modules.applications.repositories.application_repository import ApplicationRepository
 
-__all__ = ["ApplicationQueries", "ApplicationCommands"]
+__all__ = ["ApplicationQueries", "ApplicationCommands", "ApplicationRepository"]
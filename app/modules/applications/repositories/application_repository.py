@@ -0,0 +1,11 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.applications.repositories.queries import ApplicationQueries
+from app.modules.applications.repositories.commands import ApplicationCommands
+
+
+class ApplicationRepository(ApplicationQueries, ApplicationCommands):
+    """Queries and commands over one session, so a request builds a single repository object."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
@@ -1,19 +1,40 @@
 import uuid
-from datetime import datetime, timezone
-from typing import Optional, List
-from sqlalchemy import delete, select
+from functools import partial
+from typing import Any, Optional, List, Dict
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from app.config.database import run_after_commit
 from app.modules.applications.models.application import Application
 from app.modules.applications.models.user_application import UserApplication
-from app.modules.applications.schemas import ApplicationUpdateRequest
+from app.modules.applications.repositories.queries.application_queries import (
+    invalidate_application_cache,
+    invalidate_user_applications_cache,
+)
 
 
 class ApplicationCommands:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    def _invalidate_apps(self, *codes: Optional[str], app_id: Optional[uuid.UUID] = None) -> None:
+        # After commit: evicting earlier lets a concurrent get_by_code re-cache the still-committed
+        # row (e.g. an app being deactivated) for the full TTL
+        run_after_commit(self.session, partial(invalidate_application_cache, *codes, app_id=app_id))
+
+    def _invalidate_user_apps(self, *user_ids: uuid.UUID | str) -> None:
+        # After commit, so a concurrent my-apps read can't re-cache the pre-change rows
+        if user_ids:
+            run_after_commit(self.session, partial(invalidate_user_applications_cache, *user_ids))
+
+    async def _invalidate_app_users(self, app_id: uuid.UUID) -> None:
+        """Drop my-apps cache of every user assigned to app_id (rename, deactivate, delete)."""
+        result = await self.session.scalars(
+            select(UserApplication.user_id).where(UserApplication.application_id == app_id)
+        )
+        self._invalidate_user_apps(*result.all())
+
     async def create(
         self,
         name: str,
@@ -23,77 +44,129 @@ class ApplicationCommands:
         is_active: bool = True,
         single_session: bool = False,
     ) -> Application:
-        application = Application(
-            id=uuid.uuid4(),
-            name=name,
-            code=code,
-            base_url=base_url,
-            description=description,
-            is_active=is_active,
-            single_session=single_session,
+        # INSERT ... RETURNING loads server defaults (created_at/updated_at) in the same round trip
+        stmt = (
+            insert(Application)
+            .values(
+                id=uuid.uuid4(),
+                name=name,
+                code=code,
+                base_url=base_url,
+                description=description,
+                is_active=is_active,
+                single_session=single_session,
+            )
+            .returning(Application)
         )
-        self.session.add(application)
-        await self.session.flush()
-        await self.session.refresh(application)
+        result = await self.session.execute(stmt)
+        application = result.scalar_one()
+        self._invalidate_apps(code, app_id=application.id)
         return application
 
-    async def update(
-        self, app: Application, data: ApplicationUpdateRequest
-    ) -> Application:
-        update_dict = data.model_dump(exclude_unset=True)
-        for key, value in update_dict.items():
-            setattr(app, key, value)
-        await self.session.flush()
-        await self.session.refresh(app)
-        return app
+    async def update(self, app: Application, values: Dict[str, Any]) -> Application:
+        """Apply column values with one UPDATE ... RETURNING (no dirty tracking, no refresh)."""
+        if not values:
+            return app
+        old_code = app.code
+        stmt = (
+            update(Application)
+            .where(Application.id == app.id)
+            .values(**values)
+            .returning(Application)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        updated = result.scalar_one()
+        self._invalidate_apps(old_code, updated.code, app_id=updated.id)
+        await self._invalidate_app_users(updated.id)
+        return updated
 
-    async def delete(self, app: Application) -> None:
-        app.deleted_at = datetime.now(timezone.utc)
-        await self.session.flush()
+    async def delete(self, app_id: uuid.UUID) -> bool:
+        """Soft delete by id without loading the row. Returns False if it was not found."""
+        stmt = (
+            update(Application)
+            .where(Application.id == app_id, Application.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+            .returning(Application.code)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        code = result.scalar_one_or_none()
+        if code is None:
+            return False
+        self._invalidate_apps(code, app_id=app_id)
+        await self._invalidate_app_users(app_id)
+        return True
 
     async def assign_applications_to_user(
-        self, user_id: str, application_ids: List[str]
+        self, user_id: uuid.UUID | str, application_ids: List[uuid.UUID | str]
     ) -> None:
         """Add applications to user. Does not delete existing."""
-        unique_app_ids = list(set(application_ids))
-
-        for app_id in unique_app_ids:
-            # Check if already exists
-            stmt = select(UserApplication).where(
-                UserApplication.user_id == user_id,
-                UserApplication.application_id == app_id,
-            )
-            result = await self.session.execute(stmt)
-            if not result.scalar_one_or_none():
-                user_app = UserApplication(user_id=user_id, application_id=app_id)
-                self.session.add(user_app)
+        rows = [
+            {"user_id": user_id, "application_id": app_id}
+            for app_id in set(application_ids)
+        ]
+        if not rows:
+            return
 
+        # The (user_id, application_id) primary key dedups; one round trip for all ids
+        stmt = pg_insert(UserApplication).values(rows).on_conflict_do_nothing(
+            index_elements=[UserApplication.user_id, UserApplication.application_id]
+        )
+        await self.session.execute(stmt)
         await self.session.flush()
+        self._invalidate_user_apps(user_id)
+
+    async def bulk_add_user_applications(self, rows: List[Dict[str, str]]) -> None:
+        """Insert (user_id, application_id) pairs for freshly created users in one statement."""
+        if rows:
+            await self.session.execute(insert(UserApplication), rows)
+            self._invalidate_user_apps(*{row["user_id"] for row in rows})
 
-    async def add_application_to_user(self, user_id: str, application_id: str) -> None:
+    async def add_application_to_user(self, user_id: uuid.UUID, application_id: uuid.UUID) -> None:
         """Add application to user, ignoring if already exists."""
-        # Check if assignment already exists
-        stmt = select(UserApplication).where(
-            UserApplication.user_id == user_id,
-            UserApplication.application_id == application_id,
+        stmt = pg_insert(UserApplication).values(
+            user_id=user_id, application_id=application_id
+        ).on_conflict_do_nothing(
+            index_elements=[UserApplication.user_id, UserApplication.application_id]
         )
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Already assigned, skip
-            return
-
-        user_app = UserApplication(user_id=user_id, application_id=application_id)
-        self.session.add(user_app)
+        await self.session.execute(stmt)
         await self.session.flush()
+        self._invalidate_user_apps(user_id)
 
     async def remove_application_from_user(
-        self, user_id: str, application_id: str
+        self, user_id: uuid.UUID, application_id: uuid.UUID
     ) -> None:
+        await self.remove_applications_from_user(user_id, [application_id])
+
+    async def remove_applications_from_user(
+        self, user_id: uuid.UUID, application_ids: List[uuid.UUID]
+    ) -> None:
+        """Remove several applications from user in one DELETE."""
+        if not application_ids:
+            return
         stmt = delete(UserApplication).where(
             UserApplication.user_id == user_id,
-            UserApplication.application_id == application_id,
+            UserApplication.application_id.in_(application_ids),
         )
         await self.session.execute(stmt)
         await self.session.flush()
+        self._invalidate_user_apps(user_id)
+
+    async def remove_applications_from_user_by_codes(
+        self, user_id: uuid.UUID | str, codes: List[str]
+    ) -> int:
+        """Remove applications (by code) from user in one DELETE; returns rows removed."""
+        if not codes:
+            return 0
+        app_ids = select(Application.id).where(
+            Application.code.in_(codes), Application.deleted_at.is_(None)
+        )
+        stmt = delete(UserApplication).where(
+            UserApplication.user_id == user_id,
+            UserApplication.application_id.in_(app_ids),
+        )
+        result = await self.session.execute(stmt)
+        if result.rowcount:
+            self._invalidate_user_apps(user_id)
+        return result.rowcount
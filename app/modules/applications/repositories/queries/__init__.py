@@ -1,5 +1,6 @@
 from app.modules.applications.repositories.queries.application_queries import (
     ApplicationQueries,
+    invalidate_application_cache,
 )
 
-__all__ = ["ApplicationQueries"]
+__all__ = ["ApplicationQueries", "invalidate_application_cache"]
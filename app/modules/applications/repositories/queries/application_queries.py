@@ -1,50 +1,218 @@
-from typing import Optional, List
-from sqlalchemy import select, func
+import uuid
+from functools import partial
+from typing import Any, Dict, Optional, List
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import event, exists, inspect, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, make_transient_to_detached, object_session
 
+from app.config.database import run_after_commit
+from app.config.redis import RedisClient
 from app.modules.applications.models.application import Application
 from app.modules.applications.models.user_application import UserApplication
 
+# Application jarang berubah, tapi di-lookup by code di setiap login/refresh/exchange.
+# Cache menyimpan snapshot kolom (bukan ORM object) agar tidak terikat ke session lain.
+# Invalidasi hanya berlaku per proses, jadi TTL membatasi data basi di worker lain.
+_APP_BY_CODE_CACHE: TTLCache = TTLCache(maxsize=512, ttl=30)
+# Admin detail/listing (dashboard polling). Halaman listing di-key (limit, offset, is_active)
+# dan semuanya dibuang pada setiap write, karena satu perubahan bisa menggeser semua halaman.
+_APP_BY_ID_CACHE: TTLCache = TTLCache(maxsize=512, ttl=30)
+_APP_LIST_CACHE: TTLCache = TTLCache(maxsize=128, ttl=30)
+
+# Aplikasi milik user (my-apps) di Redis, shared antar worker. Yang disimpan kolom mentah,
+# bukan response, karena img/icon URL adalah signed URL yang harus dibuat ulang per request.
+# ApplicationCommands menghapus key setelah commit (assignment berubah, app diubah/dihapus);
+# read yang sudah berjalan saat commit masih bisa menulis ulang data lama, dibatasi TTL.
+USER_APPS_CACHE_PREFIX = "user_apps"
+USER_APPS_CACHE_TTL = 60
+_USER_APP_COLUMNS = (
+    Application.id,
+    Application.code,
+    Application.name,
+    Application.description,
+    Application.base_url,
+    Application.is_active,
+    Application.img_path,
+    Application.icon_path,
+)
+
+
+def user_apps_cache_key(user_id: uuid.UUID | str) -> str:
+    return f"{USER_APPS_CACHE_PREFIX}:{user_id}"
+
+
+async def invalidate_user_applications_cache(*user_ids: uuid.UUID | str) -> None:
+    """Drop cached my-apps rows for the given users (after assignment changes)."""
+    if not user_ids:
+        return
+    redis_client = await RedisClient.get_client()
+    await redis_client.delete(*{user_apps_cache_key(user_id) for user_id in user_ids})
+
+
+def invalidate_application_cache(*codes: Optional[str], app_id: Optional[uuid.UUID] = None) -> None:
+    """Evict cached application snapshots by code/id and drop cached listing pages."""
+    for code in codes:
+        if code:
+            _APP_BY_CODE_CACHE.pop(code, None)
+    if app_id is not None:
+        _APP_BY_ID_CACHE.pop(app_id, None)
+    _APP_LIST_CACHE.clear()
+
+
+def _snapshot(app: Application) -> Dict[str, Any]:
+    return {attr.key: getattr(app, attr.key) for attr in inspect(Application).column_attrs}
+
+
+@event.listens_for(Application, "after_update")
+def _evict_on_update(mapper, connection, target: Application) -> None:
+    # Covers rename (old code ada di history) dan soft delete. History dibaca saat flush,
+    # eviction ditunda sampai commit agar lookup paralel tidak meng-cache ulang row lama
+    history = inspect(target).attrs.code.history
+    run_after_commit(
+        object_session(target),
+        partial(invalidate_application_cache, target.code, *(history.deleted or ()), app_id=target.id),
+    )
+
 
 class ApplicationQueries:
+    """Read side. Soft-deleted rows are excluded by the Application loader criteria."""
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_id(self, app_id: str) -> Optional[Application]:
-        stmt = select(Application).where(Application.id == app_id, Application.deleted_at.is_(None))
+    async def get_by_id(self, app_id: uuid.UUID) -> Optional[Application]:
+        stmt = select(Application).where(Application.id == app_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, app_ids: List[uuid.UUID]) -> List[Application]:
+        """Get multiple applications by ID in a single query. Unknown IDs are skipped."""
+        if not app_ids:
+            return []
+        stmt = select(Application).where(Application.id.in_(app_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_by_id_cached(self, app_id: uuid.UUID) -> Optional[Application]:
+        """get_by_id through a short TTL cache; for read-only callers (admin detail)."""
+        cached = _APP_BY_ID_CACHE.get(app_id)
+        if cached is not None:
+            return await self._from_snapshot(cached)
+
+        app = await self.get_by_id(app_id)
+        if app:
+            _APP_BY_ID_CACHE[app_id] = _snapshot(app)
+        return app
+
     async def get_by_code(self, code: str) -> Optional[Application]:
-        stmt = select(Application).where(Application.code == code, Application.deleted_at.is_(None))
+        cached = _APP_BY_CODE_CACHE.get(code)
+        if cached is not None:
+            return await self._from_snapshot(cached)
+
+        stmt = select(Application).where(Application.code == code)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        app = result.scalar_one_or_none()
+        if app:
+            _APP_BY_CODE_CACHE[code] = _snapshot(app)
+        return app
 
-    async def get_user_applications(self, user_id: str) -> List[Application]:
+    async def code_exists(self, code: str, exclude_id: Optional[uuid.UUID] = None) -> bool:
+        """Whether a live application uses code, via SELECT EXISTS (no row hydration, no cache)."""
+        condition = exists().where(Application.code == code, Application.deleted_at.is_(None))
+        if exclude_id is not None:
+            condition = condition.where(Application.id != exclude_id)
+        return bool(await self.session.scalar(select(condition)))
+
+    async def get_by_codes(self, codes: List[str]) -> List[Application]:
+        """Get multiple applications by code in a single query. Unknown codes are skipped."""
+        if not codes:
+            return []
+        stmt = select(Application).where(Application.code.in_(codes))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_user_applications(self, user_id: uuid.UUID | str) -> List[Application]:
         stmt = (
             select(Application)
-            .join(UserApplication)
-            .where(UserApplication.user_id == user_id, Application.deleted_at.is_(None))
+            .join(UserApplication, UserApplication.application_id == Application.id)
+            .where(UserApplication.user_id == user_id)
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_user_application_rows(self, user_id: uuid.UUID | str) -> List[Dict[str, Any]]:
+        """Column values of a user's applications, cached in Redis for USER_APPS_CACHE_TTL."""
+        redis_client = await RedisClient.get_client()
+        key = user_apps_cache_key(user_id)
+        cached = await redis_client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        stmt = (
+            select(*_USER_APP_COLUMNS)
+            .join(UserApplication, UserApplication.application_id == Application.id)
+            .where(UserApplication.user_id == user_id, Application.deleted_at.is_(None))
+        )
+        result = await self.session.execute(stmt)
+        rows = [dict(row) for row in result.mappings()]
+        await redis_client.set(key, orjson.dumps(rows), ex=USER_APPS_CACHE_TTL)
+        return rows
+
+    async def count_user_applications(self, user_id: uuid.UUID | str) -> int:
+        """Count a user's (non-deleted) applications without loading them."""
+        stmt = (
+            select(func.count())
+            .select_from(UserApplication)
+            .join(Application, Application.id == UserApplication.application_id)
+            .where(UserApplication.user_id == user_id)
+        )
+        return await self.session.scalar(stmt) or 0
+
     async def list_applications(
         self,
         limit: int = 100,
         offset: int = 0,
         is_active: Optional[bool] = None,
     ) -> tuple[List[Application], int]:
-        stmt = select(Application).where(Application.deleted_at.is_(None))
-        count_stmt = select(func.count(Application.id)).where(Application.deleted_at.is_(None))
+        cache_key = (limit, offset, is_active)
+        cached = _APP_LIST_CACHE.get(cache_key)
+        if cached is not None:
+            snapshots, total = cached
+            return [await self._from_snapshot(s) for s in snapshots], total
+
+        apps, total = await self._list_applications(limit, offset, is_active)
+        _APP_LIST_CACHE[cache_key] = ([_snapshot(app) for app in apps], total)
+        return apps, total
 
+    async def _list_applications(
+        self,
+        limit: int,
+        offset: int,
+        is_active: Optional[bool],
+    ) -> tuple[List[Application], int]:
+        # Total comes back on every row via COUNT(*) OVER (), so one round trip per page
+        stmt = select(Application, func.count().over().label("total"))
         if is_active is not None:
             stmt = stmt.where(Application.is_active == is_active)
-            count_stmt = count_stmt.where(Application.is_active == is_active)
 
+        stmt = stmt.order_by(Application.created_at.desc()).limit(limit).offset(offset)
+        rows = (await self.session.execute(stmt)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        if offset == 0:
+            return [], 0
+
+        # Page past the end: no rows to carry the window total, count separately
+        count_stmt = select(func.count(Application.id))
+        if is_active is not None:
+            count_stmt = count_stmt.where(Application.is_active == is_active)
         total = await self.session.scalar(count_stmt)
-        stmt = stmt.limit(limit).offset(offset).order_by(Application.created_at.desc())
-        result = await self.session.execute(stmt)
+        return [], total or 0
 
-        return list(result.scalars().all()), total or 0
+    async def _from_snapshot(self, snapshot: Dict[str, Any]) -> Application:
+        app = Application(**snapshot)
+        make_transient_to_detached(app)
+        return await self.session.merge(app, load=False)
@@ -1,3 +1,4 @@
+import uuid
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, status, Form, File, UploadFile
@@ -107,7 +108,7 @@ async def get_my_applications(
     summary="Get application by ID (Admin only)",
 )
 async def get_application(
-    app_id: str,
+    app_id: uuid.UUID,
     service: ApplicationServiceDep,
     current_user: UserData = Depends(require_admin),
 ) -> DataResponse[ApplicationResponse]:
@@ -122,7 +123,7 @@ async def get_application(
     summary="Update application (Admin only)",
 )
 async def update_application(
-    app_id: str,
+    app_id: uuid.UUID,
     service: ApplicationServiceDep,
     name: Optional[str] = Form(None, min_length=2, max_length=255),
     code: Optional[str] = Form(None, min_length=2, max_length=100, pattern=r"^[a-z0-9_-]+$"),
@@ -155,7 +156,7 @@ async def update_application(
     summary="Delete application (Admin only)",
 )
 async def delete_application(
-    app_id: str,
+    app_id: uuid.UUID,
     service: ApplicationServiceDep,
     current_user: UserData = Depends(require_admin),
 ) -> BaseResponse:
@@ -170,7 +171,7 @@ async def delete_application(
     summary="Get user's applications (Admin only)",
 )
 async def get_user_applications(
-    user_id: str,
+    user_id: uuid.UUID,
     service: ApplicationServiceDep,
     current_user: UserData = Depends(require_admin),
 ) -> DataResponse[List[AllowedAppResponse]]:
@@ -189,7 +190,7 @@ async def get_user_applications(
     summary="Assign applications to user (Admin only)",
 )
 async def assign_applications_to_user(
-    user_id: str,
+    user_id: uuid.UUID,
     data: UserApplicationAssignRequest,
     service: ApplicationServiceDep,
     current_user: UserData = Depends(require_admin),
@@ -209,8 +210,8 @@ async def assign_applications_to_user(
     summary="Remove application from user (Admin only)",
 )
 async def remove_application_from_user(
-    user_id: str,
-    app_id: str,
+    user_id: uuid.UUID,
+    app_id: uuid.UUID,
     service: ApplicationServiceDep,
     current_user: UserData = Depends(require_admin),
 ) -> BaseResponse:
@@ -1,4 +1,5 @@
 from typing import Optional
+from uuid import UUID
 from pydantic import BaseModel, Field
 
 
@@ -28,6 +29,6 @@ class ApplicationUpdateRequest(BaseModel):
 
 
 class UserApplicationAssignRequest(BaseModel):
-    application_ids: list[str] = Field(
+    application_ids: list[UUID] = Field(
         ..., description="List of application UUIDs to assign"
     )
@@ -1,6 +1,7 @@
+from functools import cached_property
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field, field_serializer, computed_field
+from pydantic import BaseModel, Field, computed_field
 from datetime import datetime
 
 from app.core.utils.file_upload import generate_signed_url_for_path
@@ -22,18 +23,14 @@ class ApplicationListItemResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_serializer("id")
-    def serialize_id(self, v: UUID, _info):
-        return str(v)
-
     @computed_field
-    @property
+    @cached_property
     def img_url(self) -> Optional[str]:
         """Generate signed URL for application image on-demand"""
         return generate_signed_url_for_path(self.img_path) if self.img_path else None
 
     @computed_field
-    @property
+    @cached_property
     def icon_url(self) -> Optional[str]:
         """Generate signed URL for application icon on-demand"""
         return generate_signed_url_for_path(self.icon_path) if self.icon_path else None
@@ -59,18 +56,14 @@ class ApplicationResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_serializer("id")
-    def serialize_id(self, v: UUID, _info):
-        return str(v)
-
     @computed_field
-    @property
+    @cached_property
     def img_url(self) -> Optional[str]:
         """Generate signed URL for application image on-demand"""
         return generate_signed_url_for_path(self.img_path) if self.img_path else None
 
     @computed_field
-    @property
+    @cached_property
     def icon_url(self) -> Optional[str]:
         """Generate signed URL for application icon on-demand"""
         return generate_signed_url_for_path(self.icon_path) if self.icon_path else None
@@ -90,18 +83,14 @@ class AllowedAppResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_serializer("id")
-    def serialize_id(self, v: UUID, _info):
-        return str(v)
-
     @computed_field
-    @property
+    @cached_property
     def img_url(self) -> Optional[str]:
         """Generate signed URL for application image on-demand"""
         return generate_signed_url_for_path(self.img_path) if self.img_path else None
 
     @computed_field
-    @property
+    @cached_property
     def icon_url(self) -> Optional[str]:
         """Generate signed URL for application icon on-demand"""
         return generate_signed_url_for_path(self.icon_path) if self.icon_path else None
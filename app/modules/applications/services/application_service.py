@@ -4,10 +4,13 @@ Delegates business logic to specific Use Cases.
 Handles schema conversion (Model -> Response).
 """
 
+import uuid
+from functools import cached_property
 from typing import Optional, List, Tuple
 import logging
 
 from fastapi import UploadFile
+from pydantic import TypeAdapter
 
 # Repositories
 from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
@@ -31,6 +34,10 @@ from app.modules.applications.use_cases.remove_application_from_user import Remo
 
 logger = logging.getLogger(__name__)
 
+# Whole-list validators: one core pass over the ORM rows instead of a model_validate per row
+_LIST_ITEMS_ADAPTER = TypeAdapter(List[ApplicationListItemResponse])
+_ALLOWED_APPS_ADAPTER = TypeAdapter(List[AllowedAppResponse])
+
 
 class ApplicationService:
     """
@@ -47,17 +54,41 @@ class ApplicationService:
         self.queries = queries
         self.commands = commands
 
-        # Initialize Use Cases - Application CRUD
-        self.create_uc = CreateApplicationUseCase(queries, commands)
-        self.update_uc = UpdateApplicationUseCase(queries, commands)
-        self.delete_uc = DeleteApplicationUseCase(queries, commands)
-        self.get_uc = GetApplicationUseCase(queries)
-        self.list_uc = ListApplicationsUseCase(queries)
-        
-        # Initialize Use Cases - User-Application Assignment
-        self.get_user_apps_uc = GetUserApplicationsUseCase(queries)
-        self.assign_apps_uc = AssignApplicationsToUserUseCase(queries, commands)
-        self.remove_app_uc = RemoveApplicationFromUserUseCase(commands)
+    # --- Use Cases - Application CRUD (built on first use; a request touches one or two) ---
+
+    @cached_property
+    def create_uc(self) -> CreateApplicationUseCase:
+        return CreateApplicationUseCase(self.queries, self.commands)
+
+    @cached_property
+    def update_uc(self) -> UpdateApplicationUseCase:
+        return UpdateApplicationUseCase(self.queries, self.commands)
+
+    @cached_property
+    def delete_uc(self) -> DeleteApplicationUseCase:
+        return DeleteApplicationUseCase(self.queries, self.commands)
+
+    @cached_property
+    def get_uc(self) -> GetApplicationUseCase:
+        return GetApplicationUseCase(self.queries)
+
+    @cached_property
+    def list_uc(self) -> ListApplicationsUseCase:
+        return ListApplicationsUseCase(self.queries)
+
+    # --- Use Cases - User-Application Assignment ---
+
+    @cached_property
+    def get_user_apps_uc(self) -> GetUserApplicationsUseCase:
+        return GetUserApplicationsUseCase(self.queries)
+
+    @cached_property
+    def assign_apps_uc(self) -> AssignApplicationsToUserUseCase:
+        return AssignApplicationsToUserUseCase(self.queries, self.commands)
+
+    @cached_property
+    def remove_app_uc(self) -> RemoveApplicationFromUserUseCase:
+        return RemoveApplicationFromUserUseCase(self.commands)
 
     # --- Application CRUD Operations ---
 
@@ -85,7 +116,7 @@ class ApplicationService:
 
     async def update(
         self,
-        app_id: str,
+        app_id: uuid.UUID,
         name: Optional[str] = None,
         code: Optional[str] = None,
         base_url: Optional[str] = None,
@@ -109,11 +140,11 @@ class ApplicationService:
         )
         return ApplicationResponse.model_validate(app)
 
-    async def delete(self, app_id: str) -> None:
+    async def delete(self, app_id: uuid.UUID) -> None:
         """Delete an application."""
         await self.delete_uc.execute(app_id)
 
-    async def get(self, app_id: str) -> ApplicationResponse:
+    async def get(self, app_id: uuid.UUID) -> ApplicationResponse:
         """Get application by ID."""
         app = await self.get_uc.execute(app_id)
         return ApplicationResponse.model_validate(app)
@@ -131,25 +162,24 @@ class ApplicationService:
     ) -> Tuple[List[ApplicationListItemResponse], int]:
         """List applications with pagination."""
         apps, total = await self.list_uc.execute(page, limit, is_active)
-        items = [ApplicationListItemResponse.model_validate(a) for a in apps]
-        return items, total
+        return _LIST_ITEMS_ADAPTER.validate_python(apps, from_attributes=True), total
 
     # --- User-Application Assignment Operations ---
 
-    async def get_user_applications(self, user_id: str) -> List[AllowedAppResponse]:
+    async def get_user_applications(self, user_id: uuid.UUID | str) -> List[AllowedAppResponse]:
         """Get applications assigned to a user."""
         apps = await self.get_user_apps_uc.execute(user_id)
-        return [AllowedAppResponse.model_validate(a) for a in apps]
+        return _ALLOWED_APPS_ADAPTER.validate_python(apps, from_attributes=True)
 
     async def assign_applications_to_user(
-        self, user_id: str, application_ids: List[str]
+        self, user_id: uuid.UUID, application_ids: List[uuid.UUID]
     ) -> List[AllowedAppResponse]:
         """Sync user's applications. Adds new ones, removes ones not in list."""
         apps = await self.assign_apps_uc.execute(user_id, application_ids)
-        return [AllowedAppResponse.model_validate(a) for a in apps]
+        return _ALLOWED_APPS_ADAPTER.validate_python(apps, from_attributes=True)
 
     async def remove_application_from_user(
-        self, user_id: str, application_id: str
+        self, user_id: uuid.UUID, application_id: uuid.UUID
     ) -> None:
         """Remove a single application from user."""
         await self.remove_app_uc.execute(user_id, application_id)
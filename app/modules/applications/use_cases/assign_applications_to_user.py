@@ -3,6 +3,7 @@ Assign Applications to User Use Case
 """
 
 import logging
+import uuid
 from typing import List
 
 from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
@@ -24,7 +25,7 @@ class AssignApplicationsToUserUseCase:
         self.commands = commands
 
     async def execute(
-        self, user_id: str, application_ids: List[str]
+        self, user_id: uuid.UUID, application_ids: List[uuid.UUID]
     ) -> List[Application]:
         """
         Sync user's applications. Adds new ones, removes ones not in list.
@@ -32,26 +33,30 @@ class AssignApplicationsToUserUseCase:
         """
         unique_app_ids = set(application_ids)
 
-        # Validate all application IDs exist
-        for app_id in unique_app_ids:
-            app = await self.queries.get_by_id(app_id)
-            if not app:
-                raise NotFoundException(f"Aplikasi dengan ID {app_id} tidak ditemukan")
-
         existing_apps = await self.queries.get_user_applications(user_id)
-        existing_app_ids = {str(app.id) for app in existing_apps}
+        existing_app_ids = {app.id for app in existing_apps}
 
         to_add = unique_app_ids - existing_app_ids
         to_remove = existing_app_ids - unique_app_ids
 
+        # Idempotent re-sync from the admin UI: nothing to validate or write
+        if not to_add and not to_remove:
+            return existing_apps
+
+        # Already-assigned ids are known to exist; only the new ones need checking (one IN query)
+        added_apps = await self.queries.get_by_ids(list(to_add))
+        missing = to_add - {app.id for app in added_apps}
+        if missing:
+            missing_ids = ", ".join(sorted(str(app_id) for app_id in missing))
+            raise NotFoundException(f"Aplikasi dengan ID {missing_ids} tidak ditemukan")
+
         if to_add:
             await self.commands.assign_applications_to_user(user_id, list(to_add))
             logger.info(f"Added {len(to_add)} applications to user {user_id}")
 
-        for app_id in to_remove:
-            await self.commands.remove_application_from_user(user_id, app_id)
         if to_remove:
+            await self.commands.remove_applications_from_user(user_id, list(to_remove))
             logger.info(f"Removed {len(to_remove)} applications from user {user_id}")
 
-        # Return updated list
-        return await self.queries.get_user_applications(user_id)
+        # Synced set from what is already loaded: kept assignments + validated new ones
+        return [app for app in existing_apps if app.id not in to_remove] + added_apps
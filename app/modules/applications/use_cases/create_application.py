@@ -2,6 +2,7 @@
 Create Application Use Case
 """
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -10,7 +11,8 @@ from fastapi import UploadFile
 from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
 from app.modules.applications.models.application import Application
 from app.core.utils.file_upload import upload_file_to_gcp
-from app.core.exceptions import ConflictException
+from app.core.utils.retry import retry_async
+from app.core.exceptions import AppException, ConflictException
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +40,7 @@ class CreateApplicationUseCase:
     ) -> Application:
         """Execute the create application use case. Returns raw Application model."""
         # Check for existing code
-        existing = await self.queries.get_by_code(code)
-        if existing:
+        if await self.queries.code_exists(code):
             raise ConflictException(f"Aplikasi dengan kode '{code}' sudah ada")
 
         # Create application
@@ -50,33 +51,40 @@ class CreateApplicationUseCase:
             description=description,
             single_session=single_session,
         )
-        logger.info(f"Application created: {app.id} ({app.code})")
+        app_id_str = str(app.id)
+        logger.info(f"Application created: {app_id_str} ({app.code})")
 
-        # Upload files if provided
+        # Upload files if provided; img and icon are independent, so the GCS round trips overlap.
+        # Transient storage errors are retried; validation errors (AppException) are not
+        uploads = {}
         if img_file and img_file.filename:
-            try:
-                _, img_path = await upload_file_to_gcp(
+            uploads["img_path"] = retry_async(
+                lambda: upload_file_to_gcp(
                     file=img_file,
                     entity_type="applications",
-                    entity_id=str(app.id),
+                    entity_id=app_id_str,
                     subfolder="img",
-                )
-                app.img_path = img_path
-                logger.info(f"Application image uploaded: {img_path}")
-            except Exception as e:
-                logger.warning(f"Failed to upload application image: {e}")
-
+                ),
+                no_retry=(AppException,),
+            )
         if icon_file and icon_file.filename:
-            try:
-                _, icon_path = await upload_file_to_gcp(
+            uploads["icon_path"] = retry_async(
+                lambda: upload_file_to_gcp(
                     file=icon_file,
                     entity_type="applications",
-                    entity_id=str(app.id),
+                    entity_id=app_id_str,
                     subfolder="icon",
-                )
-                app.icon_path = icon_path
-                logger.info(f"Application icon uploaded: {icon_path}")
-            except Exception as e:
-                logger.warning(f"Failed to upload application icon: {e}")
+                ),
+                no_retry=(AppException,),
+            )
+
+        results = await asyncio.gather(*uploads.values(), return_exceptions=True)
+        for attr, result in zip(uploads, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to upload application {attr}: {result}")
+                continue
+            _, path = result
+            setattr(app, attr, path)
+            logger.info(f"Application {attr} uploaded: {path}")
 
         return app
@@ -3,6 +3,7 @@ Delete Application Use Case
 """
 
 import logging
+import uuid
 
 from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
 from app.core.exceptions import NotFoundException
@@ -21,11 +22,9 @@ class DeleteApplicationUseCase:
         self.queries = queries
         self.commands = commands
 
-    async def execute(self, app_id: str) -> None:
+    async def execute(self, app_id: uuid.UUID) -> None:
         """Execute the delete application use case."""
-        app = await self.queries.get_by_id(app_id)
-        if not app:
+        # Single guarded UPDATE; no preliminary SELECT to check existence
+        if not await self.commands.delete(app_id):
             raise NotFoundException("Aplikasi tidak ditemukan")
-
-        await self.commands.delete(app)
         logger.info(f"Application deleted: {app_id}")
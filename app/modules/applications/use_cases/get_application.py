@@ -2,6 +2,7 @@
 Get Application Use Case
 """
 
+import uuid
 from typing import Optional
 
 from app.modules.applications.repositories import ApplicationQueries
@@ -15,9 +16,9 @@ class GetApplicationUseCase:
     def __init__(self, queries: ApplicationQueries):
         self.queries = queries
 
-    async def execute(self, app_id: str) -> Application:
+    async def execute(self, app_id: uuid.UUID) -> Application:
         """Get application by ID. Returns raw Application model."""
-        app = await self.queries.get_by_id(app_id)
+        app = await self.queries.get_by_id_cached(app_id)
         if not app:
             raise NotFoundException("Aplikasi tidak ditemukan")
         return app
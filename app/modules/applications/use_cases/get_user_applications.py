@@ -2,10 +2,10 @@
 Get User Applications Use Case
 """
 
-from typing import List
+import uuid
+from typing import Any, Dict, List
 
 from app.modules.applications.repositories import ApplicationQueries
-from app.modules.applications.models.application import Application
 
 
 class GetUserApplicationsUseCase:
@@ -14,6 +14,6 @@ class GetUserApplicationsUseCase:
     def __init__(self, queries: ApplicationQueries):
         self.queries = queries
 
-    async def execute(self, user_id: str) -> List[Application]:
-        """Get applications assigned to a user. Returns raw Application models."""
-        return await self.queries.get_user_applications(user_id)
+    async def execute(self, user_id: uuid.UUID | str) -> List[Dict[str, Any]]:
+        """Get applications assigned to a user. Returns cached column rows."""
+        return await self.queries.get_user_application_rows(user_id)
@@ -3,6 +3,7 @@ Remove Application from User Use Case
 """
 
 import logging
+import uuid
 
 from app.modules.applications.repositories import ApplicationCommands
 
@@ -15,7 +16,7 @@ class RemoveApplicationFromUserUseCase:
     def __init__(self, commands: ApplicationCommands):
         self.commands = commands
 
-    async def execute(self, user_id: str, application_id: str) -> None:
+    async def execute(self, user_id: uuid.UUID, application_id: uuid.UUID) -> None:
         """Remove a single application from user."""
         await self.commands.remove_application_from_user(user_id, application_id)
         logger.info(f"Removed application {application_id} from user {user_id}")
@@ -4,18 +4,25 @@ Update Application Use Case
 
 import logging
 import asyncio
-from typing import Optional
+import uuid
+from functools import partial
+from typing import Optional, Set
 
 from fastapi import UploadFile
 
 from app.modules.applications.repositories import ApplicationQueries, ApplicationCommands
 from app.modules.applications.models.application import Application
+from app.config.database import run_after_commit
 from app.core.utils.file_upload import upload_file_to_gcp
 from app.core.utils.gcp_storage import get_gcp_storage_client
-from app.core.exceptions import NotFoundException, ConflictException
+from app.core.utils.retry import retry_async
+from app.core.exceptions import AppException, NotFoundException, ConflictException
 
 logger = logging.getLogger(__name__)
 
+# Asset column -> GCS subfolder
+_SUBFOLDERS = {"img_path": "img", "icon_path": "icon"}
+
 
 class UpdateApplicationUseCase:
     """Use Case for updating an application."""
@@ -30,7 +37,7 @@ class UpdateApplicationUseCase:
 
     async def execute(
         self,
-        app_id: str,
+        app_id: uuid.UUID,
         name: Optional[str] = None,
         code: Optional[str] = None,
         base_url: Optional[str] = None,
@@ -47,63 +54,100 @@ class UpdateApplicationUseCase:
 
         # Check code uniqueness if changing
         if code and code != app.code:
-            existing = await self.queries.get_by_code(code)
-            if existing:
+            if await self.queries.code_exists(code, exclude_id=app.id):
                 raise ConflictException(f"Aplikasi dengan kode '{code}' sudah ada")
 
-        # Handle img file upload
-        if img_file and img_file.filename:
-            try:
-                # Delete old image if exists
-                if app.img_path:
-                    storage_client = get_gcp_storage_client()
-                    await asyncio.to_thread(storage_client.delete_file, app.img_path)
-                    logger.info(f"Old application image deleted: {app.img_path}")
-                
-                _, img_path = await upload_file_to_gcp(
-                    file=img_file,
-                    entity_type="applications",
-                    entity_id=str(app.id),
-                    subfolder="img",
-                )
-                app.img_path = img_path
-                logger.info(f"Application image updated: {img_path}")
-            except Exception as e:
-                logger.warning(f"Failed to upload new application image: {e}")
-
-        # Handle icon file upload
-        if icon_file and icon_file.filename:
-            try:
-                # Delete old icon if exists
-                if app.icon_path:
-                    storage_client = get_gcp_storage_client()
-                    await asyncio.to_thread(storage_client.delete_file, app.icon_path)
-                    logger.info(f"Old application icon deleted: {app.icon_path}")
-                
-                _, icon_path = await upload_file_to_gcp(
-                    file=icon_file,
-                    entity_type="applications",
-                    entity_id=str(app.id),
-                    subfolder="icon",
+        # Collected column values, written in one UPDATE ... RETURNING at the end.
+        # Only fields that actually differ, so an idempotent save from the admin UI writes nothing
+        fields = {
+            "name": name,
+            "code": code,
+            "base_url": base_url,
+            "description": description,
+            "is_active": is_active,
+            "single_session": single_session,
+        }
+        values = {
+            attr: value
+            for attr, value in fields.items()
+            if value is not None and value != getattr(app, attr)
+        }
+
+        has_img = bool(img_file and img_file.filename)
+        has_icon = bool(icon_file and icon_file.filename)
+        if not values and not has_img and not has_icon:
+            return app
+
+        # img and icon uploads run concurrently
+        replacements = {}
+        app_id_str = str(app.id)
+        if has_img:
+            replacements["img_path"] = self._upload_asset(app_id_str, img_file, _SUBFOLDERS["img_path"])
+        if has_icon:
+            replacements["icon_path"] = self._upload_asset(app_id_str, icon_file, _SUBFOLDERS["icon_path"])
+
+        # Old blobs replaced by a successful upload; only deleted once the new path is committed
+        old_paths = {}
+        results = await asyncio.gather(*replacements.values(), return_exceptions=True)
+        for attr, result in zip(replacements, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to upload new application {attr}: {result}")
+            else:
+                old_paths[attr] = getattr(app, attr)
+                values[attr] = result
+                logger.info(f"Application {attr} updated: {result}")
+
+        app = await self.commands.update(app, values)
+
+        # If the UPDATE or the request's commit fails, the row keeps its old blobs
+        for attr, old_path in old_paths.items():
+            if old_path:
+                run_after_commit(
+                    self.commands.session,
+                    partial(_delete_in_background, old_path, _SUBFOLDERS[attr]),
                 )
-                app.icon_path = icon_path
-                logger.info(f"Application icon updated: {icon_path}")
-            except Exception as e:
-                logger.warning(f"Failed to upload new application icon: {e}")
-
-        # Update other fields
-        if name is not None:
-            app.name = name
-        if code is not None:
-            app.code = code
-        if base_url is not None:
-            app.base_url = base_url
-        if description is not None:
-            app.description = description
-        if is_active is not None:
-            app.is_active = is_active
-        if single_session is not None:
-            app.single_session = single_session
 
         logger.info(f"Application updated: {app_id}")
         return app
+
+    @staticmethod
+    async def _upload_asset(
+        app_id_str: str,
+        new_file: UploadFile,
+        subfolder: str,
+    ) -> str:
+        """Upload new_file. Returns the new path."""
+        _, new_path = await retry_async(
+            lambda: upload_file_to_gcp(
+                file=new_file,
+                entity_type="applications",
+                entity_id=app_id_str,
+                subfolder=subfolder,
+            ),
+            no_retry=(AppException,),
+        )
+        return new_path
+
+
+# Strong refs so pending delete tasks are not garbage-collected before they finish
+_background_deletes: Set[asyncio.Task] = set()
+
+
+def _delete_in_background(path: str, subfolder: str) -> None:
+    # Client lookup inside the thread too, so any failure surfaces in _done, not in the caller
+    task = asyncio.create_task(asyncio.to_thread(lambda: get_gcp_storage_client().delete_file(path)))
+    _background_deletes.add(task)
+
+    def _done(t: asyncio.Task) -> None:
+        _background_deletes.discard(t)
+        if t.cancelled():
+            return
+        error = t.exception()
+        if error is not None:
+            logger.warning(f"Failed to delete old application {subfolder} {path}: {error}")
+        elif t.result():
+            logger.info(f"Old application {subfolder} deleted: {path}")
+        else:
+            logger.warning(f"Failed to delete old application {subfolder}: {path}")
+
+    task.add_done_callback(_done)
@@ -1,10 +1,10 @@
+from dataclasses import dataclass
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-import redis.asyncio as redis
 
-from app.config import get_db, get_redis
+from app.config import get_db
 from app.modules.auth.repositories import AuthProviderQueries, AuthProviderCommands
 from app.modules.auth.services import (
     SessionService,
@@ -20,115 +20,102 @@ from app.modules.applications.repositories.queries.application_queries import (
 )
 
 
-def get_auth_queries(db: AsyncSession = Depends(get_db)) -> AuthProviderQueries:
+async def get_auth_queries(db: AsyncSession = Depends(get_db)) -> AuthProviderQueries:
     return AuthProviderQueries(db)
 
 
-def get_auth_commands(db: AsyncSession = Depends(get_db)) -> AuthProviderCommands:
+async def get_auth_commands(db: AsyncSession = Depends(get_db)) -> AuthProviderCommands:
     return AuthProviderCommands(db)
 
 
-def get_user_queries(db: AsyncSession = Depends(get_db)) -> UserQueries:
-    return UserQueries(db)
+# Stateless wrappers over the shared Redis client, built once in lifespan
+async def get_session_service(request: Request) -> SessionService:
+    return request.app.state.session_service
 
 
-def get_user_commands(db: AsyncSession = Depends(get_db)) -> UserCommands:
-    return UserCommands(db)
+async def get_sso_session_service(request: Request) -> SSOSessionService:
+    return request.app.state.sso_session_service
 
 
-def get_app_queries(db: AsyncSession = Depends(get_db)) -> ApplicationQueries:
-    return ApplicationQueries(db)
+@dataclass(frozen=True, slots=True)
+class AuthDeps:
+    """Everything the auth services are built from, resolved as one dependency."""
 
+    auth_queries: AuthProviderQueries
+    auth_commands: AuthProviderCommands
+    user_queries: UserQueries
+    user_commands: UserCommands
+    session_service: SessionService
+    sso_session_service: SSOSessionService
+    app_queries: ApplicationQueries
 
-def get_session_service(
-    redis_client: redis.Redis = Depends(get_redis),
-) -> SessionService:
-    return SessionService(redis_client)
+
+async def get_auth_deps(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> AuthDeps:
+    # Repositories wrap the one request session directly instead of one provider each
+    state = request.app.state
+    return AuthDeps(
+        auth_queries=AuthProviderQueries(db),
+        auth_commands=AuthProviderCommands(db),
+        user_queries=UserQueries(db),
+        user_commands=UserCommands(db),
+        session_service=state.session_service,
+        sso_session_service=state.sso_session_service,
+        app_queries=ApplicationQueries(db),
+    )
 
 
-def get_sso_session_service(
-    redis_client: redis.Redis = Depends(get_redis),
-) -> SSOSessionService:
-    return SSOSessionService(redis_client)
+AuthDepsDep = Annotated[AuthDeps, Depends(get_auth_deps)]
 
 
-def get_auth_service(
-    user_queries: UserQueries = Depends(get_user_queries),
-    session_service: SessionService = Depends(get_session_service),
-    sso_session_service: SSOSessionService = Depends(get_sso_session_service),
-    app_queries: ApplicationQueries = Depends(get_app_queries),
-) -> AuthService:
+async def get_auth_service(deps: AuthDepsDep) -> AuthService:
     return AuthService(
-        user_queries=user_queries,
-        session_service=session_service,
-        sso_session_service=sso_session_service,
-        app_queries=app_queries,
+        user_queries=deps.user_queries,
+        session_service=deps.session_service,
+        sso_session_service=deps.sso_session_service,
+        app_queries=deps.app_queries,
     )
 
 
-def get_email_auth_service(
-    auth_queries: AuthProviderQueries = Depends(get_auth_queries),
-    auth_commands: AuthProviderCommands = Depends(get_auth_commands),
-    user_queries: UserQueries = Depends(get_user_queries),
-    session_service: SessionService = Depends(get_session_service),
-    sso_session_service: SSOSessionService = Depends(get_sso_session_service),
-    app_queries: ApplicationQueries = Depends(get_app_queries),
-) -> EmailAuthService:
+async def get_email_auth_service(deps: AuthDepsDep) -> EmailAuthService:
     return EmailAuthService(
-        auth_queries=auth_queries,
-        auth_commands=auth_commands,
-        user_queries=user_queries,
-        session_service=session_service,
-        sso_session_service=sso_session_service,
-        app_queries=app_queries,
+        auth_queries=deps.auth_queries,
+        auth_commands=deps.auth_commands,
+        user_queries=deps.user_queries,
+        session_service=deps.session_service,
+        sso_session_service=deps.sso_session_service,
+        app_queries=deps.app_queries,
     )
 
 
-def get_firebase_auth_service(
-    auth_queries: AuthProviderQueries = Depends(get_auth_queries),
-    auth_commands: AuthProviderCommands = Depends(get_auth_commands),
-    user_queries: UserQueries = Depends(get_user_queries),
-    user_commands: UserCommands = Depends(get_user_commands),
-    session_service: SessionService = Depends(get_session_service),
-    sso_session_service: SSOSessionService = Depends(get_sso_session_service),
-    app_queries: ApplicationQueries = Depends(get_app_queries),
-) -> FirebaseAuthService:
+async def get_firebase_auth_service(deps: AuthDepsDep) -> FirebaseAuthService:
     return FirebaseAuthService(
-        auth_queries=auth_queries,
-        auth_commands=auth_commands,
-        user_queries=user_queries,
-        user_commands=user_commands,
-        session_service=session_service,
-        sso_session_service=sso_session_service,
-        app_queries=app_queries,
+        auth_queries=deps.auth_queries,
+        auth_commands=deps.auth_commands,
+        user_queries=deps.user_queries,
+        user_commands=deps.user_commands,
+        session_service=deps.session_service,
+        sso_session_service=deps.sso_session_service,
+        app_queries=deps.app_queries,
     )
 
 
-def get_oauth_google_service(
-    auth_queries: AuthProviderQueries = Depends(get_auth_queries),
-    auth_commands: AuthProviderCommands = Depends(get_auth_commands),
-    user_queries: UserQueries = Depends(get_user_queries),
-    user_commands: UserCommands = Depends(get_user_commands),
-    session_service: SessionService = Depends(get_session_service),
-    sso_session_service: SSOSessionService = Depends(get_sso_session_service),
-    app_queries: ApplicationQueries = Depends(get_app_queries),
-) -> OAuth2GoogleService:
+async def get_oauth_google_service(deps: AuthDepsDep) -> OAuth2GoogleService:
     return OAuth2GoogleService(
-        auth_queries=auth_queries,
-        auth_commands=auth_commands,
-        user_queries=user_queries,
-        user_commands=user_commands,
-        session_service=session_service,
-        sso_session_service=sso_session_service,
-        app_queries=app_queries,
+        auth_queries=deps.auth_queries,
+        auth_commands=deps.auth_commands,
+        user_queries=deps.user_queries,
+        user_commands=deps.user_commands,
+        session_service=deps.session_service,
+        sso_session_service=deps.sso_session_service,
+        app_queries=deps.app_queries,
     )
 
 
-
-
 AuthQueriesDep = Annotated[AuthProviderQueries, Depends(get_auth_queries)]
 AuthCommandsDep = Annotated[AuthProviderCommands, Depends(get_auth_commands)]
-UserQueriesDep = Annotated[UserQueries, Depends(get_user_queries)]
 SessionServiceDep = Annotated[SessionService, Depends(get_session_service)]
 SSOSessionServiceDep = Annotated[SSOSessionService, Depends(get_sso_session_service)]
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
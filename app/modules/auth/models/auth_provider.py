@@ -7,7 +7,6 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
-    UniqueConstraint,
     Index,
     func,
 )
@@ -47,7 +46,15 @@ class AuthProvider(Base):
     )
 
     __table_args__ = (
-        UniqueConstraint("provider", "provider_user_id", name="uq_provider_user"),
+        # Uniqueness of (provider, provider_user_id) and the login identity lookup in one
+        # btree: id/user_id/password_hash are read from the index (no heap fetch)
+        Index(
+            "uq_auth_provider_lookup",
+            "provider",
+            "provider_user_id",
+            unique=True,
+            postgresql_include=["id", "user_id", "password_hash"],
+        ),
         Index("ix_auth_provider_user", "user_id"),
     )
 
@@ -1,9 +1,17 @@
 import uuid
-from typing import Optional
+from functools import partial
+from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
+from sqlalchemy import DateTime, Integer, column, insert, or_, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.database import run_after_commit
+from app.config.redis import RedisClient
 from app.modules.auth.models.auth_provider import AuthProvider
+from app.modules.auth.repositories.queries.auth_queries import invalidate_identity
+
+# Hash of auth_provider id -> ISO last_used_at, drained to Postgres by the last-used flusher
+LAST_USED_BUFFER_KEY = "auth_provider:last_used"
 
 
 class AuthProviderCommands:
@@ -17,22 +25,61 @@ class AuthProviderCommands:
         provider_user_id: str,
         password_hash: Optional[str] = None,
     ) -> AuthProvider:
-        auth_provider = AuthProvider(
-            user_id=user_id,
-            provider=provider,
-            provider_user_id=provider_user_id,
-            password_hash=password_hash,
+        # INSERT ... RETURNING loads id and server defaults in the same round trip
+        stmt = (
+            insert(AuthProvider)
+            .values(
+                user_id=user_id,
+                provider=provider,
+                provider_user_id=provider_user_id,
+                password_hash=password_hash,
+            )
+            .returning(AuthProvider)
         )
-        self.session.add(auth_provider)
-        await self.session.flush()
-        await self.session.refresh(auth_provider)
-        return auth_provider
+        result = await self.session.execute(stmt)
+        run_after_commit(self.session, partial(invalidate_identity, provider, provider_user_id))
+        return result.scalar_one()
 
-    async def update_last_used(self, auth_provider: AuthProvider) -> AuthProvider:
-        auth_provider.last_used_at = datetime.now(timezone.utc)
-        await self.session.flush()
-        return auth_provider
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert many auth providers in one statement."""
+        if rows:
+            await self.session.execute(insert(AuthProvider), rows)
+
+    async def update_last_used(self, provider_id: int) -> datetime:
+        """Buffer last_used_at in Redis; login paths issue no UPDATE for it."""
+        last_used_at = datetime.now(timezone.utc)
+        redis_client = await RedisClient.get_client()
+        await redis_client.hset(LAST_USED_BUFFER_KEY, str(provider_id), last_used_at.isoformat())
+        return last_used_at
+
+    async def bulk_update_last_used(self, last_used: Dict[int, datetime]) -> None:
+        """Write buffered timestamps in one UPDATE ... FROM (VALUES ...); never moves one back."""
+        if not last_used:
+            return
+        rows = values(
+            column("id", Integer),
+            column("last_used_at", DateTime(timezone=True)),
+            name="buffered",
+        ).data(list(last_used.items()))
+        stmt = (
+            update(AuthProvider)
+            .where(
+                AuthProvider.id == rows.c.id,
+                # Monotonic: a late duplicate flush never moves the timestamp backwards
+                or_(
+                    AuthProvider.last_used_at.is_(None),
+                    AuthProvider.last_used_at < rows.c.last_used_at,
+                ),
+            )
+            .values(last_used_at=rows.c.last_used_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
 
     async def delete(self, auth_provider: AuthProvider) -> None:
+        run_after_commit(
+            self.session,
+            partial(invalidate_identity, auth_provider.provider, auth_provider.provider_user_id),
+        )
         await self.session.delete(auth_provider)
         await self.session.flush()
@@ -1,11 +1,54 @@
+import uuid
+from dataclasses import dataclass
 from typing import Optional
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.modules.auth.models.auth_provider import AuthProvider
 from app.modules.users.models.user import User
 
+# Login lookup built once; per call only the bound values change, so the engine's
+# compiled cache (query_cache_size) is hit without rebuilding the statement
+_IDENTITY_BY_PROVIDER_USER_ID = (
+    select(AuthProvider.id, AuthProvider.user_id, AuthProvider.password_hash)
+    .join(User)
+    .where(
+        AuthProvider.provider == bindparam("provider"),
+        AuthProvider.provider_user_id == bindparam("provider_user_id"),
+        User.deleted_at.is_(None),
+    )
+)
+
+# Identity yang sama di-lookup berkali-kali per detik saat login burst. Cache per proses
+# menyimpan nilai kolom (bukan ORM object). Invalidasi (create/delete provider, soft delete
+# user) hanya berlaku di proses yang melakukan write: di worker lain, provider yang dihapus
+# atau user yang di-soft delete masih bisa lolos cek identity/password sampai 3 detik (TTL).
+# Miss tidak di-cache agar provider yang baru di-link langsung terlihat.
+_IDENTITY_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthIdentity:
+    """Kolom auth provider yang dibutuhkan login, lepas dari session."""
+
+    id: int
+    user_id: uuid.UUID
+    password_hash: Optional[str]
+
+
+def invalidate_identity(provider: str, provider_user_id: str) -> None:
+    """Evict cached identity untuk (provider, provider_user_id)."""
+    _IDENTITY_CACHE.pop((provider, provider_user_id), None)
+
+
+def invalidate_user_identities(user_id: uuid.UUID | str) -> None:
+    """Evict semua cached identity milik user (soft delete); scan dibatasi maxsize."""
+    user_id = str(user_id)
+    for key, identity in list(_IDENTITY_CACHE.items()):
+        if str(identity.user_id) == user_id:
+            _IDENTITY_CACHE.pop(key, None)
+
 
 class AuthProviderQueries:
     def __init__(self, session: AsyncSession):
@@ -16,21 +59,21 @@ class AuthProviderQueries:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_by_provider_user_id(
+    async def get_identity(
         self, provider: str, provider_user_id: str
-    ) -> Optional[AuthProvider]:
-        stmt = (
-            select(AuthProvider)
-            .join(User)
-            .where(
-                AuthProvider.provider == provider,
-                AuthProvider.provider_user_id == provider_user_id,
-                User.deleted_at.is_(None),
+    ) -> Optional[AuthIdentity]:
+        key = (provider, provider_user_id)
+        identity = _IDENTITY_CACHE.get(key)
+        if identity is None:
+            result = await self.session.execute(
+                _IDENTITY_BY_PROVIDER_USER_ID,
+                {"provider": provider, "provider_user_id": provider_user_id},
             )
-            .options(selectinload(AuthProvider.user))
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+            row = result.one_or_none()
+            if row is None:
+                return None
+            identity = _IDENTITY_CACHE[key] = AuthIdentity(*row)
+        return identity
 
     async def get_by_user_id(self, user_id: str) -> list[AuthProvider]:
         stmt = select(AuthProvider).where(AuthProvider.user_id == user_id)
@@ -1,6 +1,10 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
 
+import orjson
 from fastapi import APIRouter, Depends, Header, Request, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from app.core.schemas import BaseResponse, DataResponse
 from app.core.security import get_current_user
 from app.modules.auth.dependencies import (
@@ -23,9 +27,27 @@ from app.modules.auth.schemas import (
 router = APIRouter()
 
 
+def _data_json(message: str, data: Union[BaseModel, Dict[str, Any]]) -> ORJSONResponse:
+    """DataResponse-shaped body serialized straight by orjson.
+
+    Endpoints using it declare response_model=None (the schema stays documented via
+    responses=); the payload is already a validated model or a plain dict built by the
+    handler, so no DataResponse wrapper is constructed and there is no second pass.
+    """
+    return ORJSONResponse(
+        {
+            "error": False,
+            "message": message,
+            "timestamp": datetime.utcnow().isoformat(),
+            "data": data.model_dump() if isinstance(data, BaseModel) else data,
+        }
+    )
+
+
 @router.post(
     "/login/email",
-    response_model=DataResponse[LoginResponse],
+    response_model=None,
+    responses={200: {"model": DataResponse[LoginResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Login dengan email dan password",
 )
@@ -33,14 +55,14 @@ async def login_with_email(
     request: Request,
     data: EmailPasswordLoginRequest,
     email_auth_service: EmailAuthServiceDep,
-) -> DataResponse[LoginResponse]:
+) -> ORJSONResponse:
     """
     Login dengan email dan password.
 
     - Jika client_id disediakan: login ke app tertentu, dapat sso_token + access_token
     - Jika client_id null/kosong: SSO-only login, hanya dapat sso_token + allowed_apps
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = request.state.client_ip
     result = await email_auth_service.login(
         email=data.email,
         password=data.password,
@@ -52,18 +74,14 @@ async def login_with_email(
     )
 
     if data.client_id:
-        return DataResponse(error=False, message="Login berhasil", data=result)
-    else:
-        return DataResponse(
-            error=False,
-            message="Login SSO berhasil. Silakan pilih aplikasi.",
-            data=result,
-        )
+        return _data_json("Login berhasil", result)
+    return _data_json("Login SSO berhasil. Silakan pilih aplikasi.", result)
 
 
 @router.post(
     "/login/firebase",
-    response_model=DataResponse[LoginResponse],
+    response_model=None,
+    responses={200: {"model": DataResponse[LoginResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Login dengan Firebase token",
 )
@@ -71,15 +89,16 @@ async def login_with_firebase(
     request: Request,
     data: FirebaseLoginRequest,
     firebase_auth_service: FirebaseAuthServiceDep,
-) -> DataResponse[LoginResponse]:
-    ip_address = request.client.host if request.client else None
+) -> ORJSONResponse:
+    ip_address = request.state.client_ip
     result = await firebase_auth_service.login(data, ip_address=ip_address)
-    return DataResponse(error=False, message="Login berhasil", data=result)
+    return _data_json("Login berhasil", result)
 
 
 @router.get(
     "/login/google",
-    response_model=DataResponse[dict],
+    response_model=None,
+    responses={200: {"model": DataResponse[dict]}},
     status_code=status.HTTP_200_OK,
     summary="Get Google OAuth2 authorization URL",
 )
@@ -87,21 +106,18 @@ async def get_google_auth_url(
     oauth_service: OAuth2GoogleServiceDep,
     redirect_uri: str = Query(..., description="Redirect URI setelah OAuth"),
     state: Optional[str] = Query(None, description="State parameter untuk security"),
-) -> DataResponse[dict]:
+) -> ORJSONResponse:
     """Generate Google OAuth2 authorization URL."""
     auth_url = oauth_service.get_authorization_url(
         redirect_uri=redirect_uri, state=state
     )
-    return DataResponse(
-        error=False,
-        message="Google OAuth URL berhasil dibuat",
-        data={"auth_url": auth_url},
-    )
+    return _data_json("Google OAuth URL berhasil dibuat", {"auth_url": auth_url})
 
 
 @router.get(
     "/login/google/callback",
-    response_model=DataResponse[LoginResponse],
+    response_model=None,
+    responses={200: {"model": DataResponse[LoginResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Handle Google OAuth2 redirect callback (browser)",
 )
@@ -120,17 +136,16 @@ async def google_oauth_callback(
     scope: Optional[str] = Query(None),
     fcm_token: Optional[str] = Query(None, description="FCM token"),
     device_info: Optional[str] = Query(None, description="Device info as JSON string"),
-) -> DataResponse[LoginResponse]:
+) -> ORJSONResponse:
     """Handle redirect dari Google. client_id optional untuk SSO-only login."""
-    ip_address = request.client.host if request.client else None
-
-    import json as json_module
+    ip_address = request.state.client_ip
 
+    # Malformed device_info is ignored rather than failing the login
     parsed_device_info = None
     if device_info:
         try:
-            parsed_device_info = json_module.loads(device_info)
-        except:
+            parsed_device_info = orjson.loads(device_info)
+        except orjson.JSONDecodeError:
             pass
 
     result = await oauth_service.handle_callback(
@@ -142,12 +157,13 @@ async def google_oauth_callback(
         ip_address=ip_address,
         fcm_token=fcm_token,
     )
-    return DataResponse(error=False, message="Login berhasil", data=result)
+    return _data_json("Login berhasil", result)
 
 
 @router.post(
     "/exchange",
-    response_model=DataResponse[LoginResponse],
+    response_model=None,
+    responses={200: {"model": DataResponse[LoginResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Exchange SSO token untuk mendapat token aplikasi lain",
 )
@@ -155,7 +171,7 @@ async def exchange_sso_token(
     request: Request,
     data: SSOTokenExchangeRequest,
     auth_service: AuthServiceDep,
-) -> DataResponse[LoginResponse]:
+) -> ORJSONResponse:
     """
     Exchange SSO session token untuk mendapat access_token dan refresh_token
     untuk aplikasi lain tanpa harus login ulang.
@@ -165,7 +181,7 @@ async def exchange_sso_token(
     2. User buka app B → call /exchange dengan sso_token + client_id app B
     3. User dapat tokens untuk app B tanpa login lagi
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = request.state.client_ip
     result = await auth_service.exchange_sso_token(
         sso_token=data.sso_token,
         client_id=data.client_id,
@@ -174,28 +190,25 @@ async def exchange_sso_token(
         ip_address=ip_address,
         fcm_token=data.fcm_token,
     )
-    return DataResponse(
-        error=False,
-        message=f"Token exchange berhasil untuk aplikasi {data.client_id}",
-        data=result,
-    )
+    return _data_json(f"Token exchange berhasil untuk aplikasi {data.client_id}", result)
 
 
 @router.post(
     "/refresh",
-    response_model=DataResponse[RefreshResponse],
+    response_model=None,
+    responses={200: {"model": DataResponse[RefreshResponse]}},
     status_code=status.HTTP_200_OK,
     summary="Refresh access token",
 )
 async def refresh_token(
     data: RefreshTokenRequest,
     auth_service: AuthServiceDep,
-) -> DataResponse[RefreshResponse]:
+) -> ORJSONResponse:
     """Refresh access token menggunakan refresh token dan device_id."""
     result = await auth_service.refresh_token(
         data.refresh_token, device_id=data.device_id
     )
-    return DataResponse(error=False, message="Token berhasil diperbarui", data=result)
+    return _data_json("Token berhasil diperbarui", result)
 
 
 @router.post(
@@ -270,13 +283,14 @@ async def logout_sso(
 
 @router.post(
     "/validate",
-    response_model=DataResponse[UserData],
+    response_model=None,
+    responses={200: {"model": DataResponse[UserData]}},
     status_code=status.HTTP_200_OK,
     summary="Validate access token (untuk backend services)",
 )
 async def validate_token(
     current_user: UserData = Depends(get_current_user),
-) -> DataResponse[UserData]:
+) -> ORJSONResponse:
     """
     Validate JWT access token dan return user data.
     Endpoint ini untuk backend services yang perlu verify token.
@@ -285,23 +299,20 @@ async def validate_token(
     POST /api/v1/auth/validate
     Authorization: Bearer <access_token>
     """
-    return DataResponse(
-        error=False,
-        message="Token valid",
-        data=current_user,
-    )
+    return _data_json("Token valid", current_user)
 
 
 @router.get(
     "/sessions",
-    response_model=DataResponse[dict],
+    response_model=None,
+    responses={200: {"model": DataResponse[dict]}},
     status_code=status.HTTP_200_OK,
     summary="Lihat semua sesi aktif (grouped by client)",
 )
 async def list_sessions(
     session_service: SessionServiceDep,
     current_user: UserData = Depends(get_current_user),
-) -> DataResponse[dict]:
+) -> ORJSONResponse:
     """
     Returns sessions grouped by client_id:
     {
@@ -317,13 +328,10 @@ async def list_sessions(
     """
     all_sessions = await session_service.get_all_sessions(current_user.id)
 
-    # Group by client_id
+    # Group by client_id in one pass
     grouped = {}
     for session in all_sessions:
-        client_id = session.get("client_id", "unknown")
-        if client_id not in grouped:
-            grouped[client_id] = []
-        grouped[client_id].append(
+        grouped.setdefault(session.get("client_id", "unknown"), []).append(
             {
                 "device_id": session["device_id"],
                 "device_info": session.get("device_info"),
@@ -333,10 +341,9 @@ async def list_sessions(
             }
         )
 
-    return DataResponse(
-        error=False,
-        message=f"Ditemukan {len(all_sessions)} sesi aktif di {len(grouped)} aplikasi",
-        data={
+    return _data_json(
+        f"Ditemukan {len(all_sessions)} sesi aktif di {len(grouped)} aplikasi",
+        {
             "sessions": grouped,
             "total_clients": len(grouped),
             "total_sessions": len(all_sessions),
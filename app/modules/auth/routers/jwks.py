@@ -5,15 +5,17 @@ Exposes the public key in JWK format for token verification by other services.
 Standard OAuth2/OIDC endpoint: /.well-known/jwks.json
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response, status
 
-from app.modules.auth.utils.jwks_helper import get_cached_jwk
+from app.modules.auth.utils.jwks_helper import get_cached_jwks_body
 
 router = APIRouter()
 
+_CACHE_CONTROL = "public, max-age=3600"
+
 
 @router.get("/.well-known/jwks.json", tags=["JWKS"])
-async def get_jwks():
+async def get_jwks(request: Request) -> Response:
     """
     Get the JSON Web Key Set (JWKS).
 
@@ -22,5 +24,11 @@ async def get_jwks():
     needing a local copy of the public key file.
 
     No authentication required (public endpoint).
+    Served from pre-serialized bytes; clients revalidating with
+    If-None-Match get a 304 without a body.
     """
-    return {"keys": [get_cached_jwk()]}
+    body, etag = get_cached_jwks_body()
+    headers = {"Cache-Control": _CACHE_CONTROL, "ETag": etag}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
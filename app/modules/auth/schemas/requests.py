@@ -1,8 +1,30 @@
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, EmailStr
+import re
+from typing import Annotated, Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, EmailStr
+
+
+# Built once and never mutated after validation; extra keys are dropped
+_FROZEN = ConfigDict(extra="ignore", frozen=True)
+
+# Login only needs a plausible ASCII address to look up; full RFC/IDN checks
+# (email-validator) stay on RegisterRequest where the address gets stored
+_EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+
+
+def _check_login_email(value: str) -> str:
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    # Same normalization as EmailStr: domain is case-insensitive, local part is kept
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+LoginEmail = Annotated[str, AfterValidator(_check_login_email)]
 
 
 class FirebaseLoginRequest(BaseModel):
+    model_config = _FROZEN
+
     firebase_token: str = Field(..., min_length=1, description="Firebase ID token")
     client_id: Optional[str] = Field(
         None,
@@ -22,7 +44,9 @@ class FirebaseLoginRequest(BaseModel):
 
 
 class EmailPasswordLoginRequest(BaseModel):
-    email: EmailStr = Field(..., description="User email")
+    model_config = _FROZEN
+
+    email: LoginEmail = Field(..., description="User email")
     password: str = Field(..., min_length=6, description="User password")
     client_id: Optional[str] = Field(
         None,
@@ -42,17 +66,23 @@ class EmailPasswordLoginRequest(BaseModel):
 
 
 class RefreshTokenRequest(BaseModel):
+    model_config = _FROZEN
+
     refresh_token: str = Field(..., min_length=1, description="JWT refresh token")
     device_id: str = Field(..., min_length=1, description="Device ID from login")
 
 
 class LogoutRequest(BaseModel):
+    model_config = _FROZEN
+
     device_id: Optional[str] = Field(
         None, description="Device ID to logout. If None, logout all devices"
     )
 
 
 class RegisterRequest(BaseModel):
+    model_config = _FROZEN
+
     name: str = Field(..., min_length=2, max_length=100, description="User name")
     email: EmailStr = Field(..., description="User email")
     password: str = Field(..., min_length=6, description="Password for email auth")
@@ -62,6 +92,8 @@ class RegisterRequest(BaseModel):
 
 
 class OAuth2GoogleCallbackRequest(BaseModel):
+    model_config = _FROZEN
+
     code: str = Field(..., min_length=1, description="Authorization code dari Google")
     client_id: Optional[str] = Field(
         None,
@@ -84,6 +116,8 @@ class OAuth2GoogleCallbackRequest(BaseModel):
 class SSOTokenExchangeRequest(BaseModel):
     """Request untuk exchange SSO token ke app-specific tokens."""
 
+    model_config = _FROZEN
+
     sso_token: str = Field(..., min_length=1, description="Global SSO session token")
     client_id: str = Field(
         ...,
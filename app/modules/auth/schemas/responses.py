@@ -1,17 +1,25 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
+# Built once and never mutated after validation; extra keys are dropped
+_FROZEN = ConfigDict(extra="ignore", frozen=True)
+
+
 class AllowedApp(BaseModel):
     """Minimal app info for allowed apps list."""
 
+    model_config = _FROZEN
+
     id: str = Field(..., description="Application UUID")
     code: str = Field(..., description="Application code")
     name: str = Field(..., description="Application name")
     base_url: Optional[str] = Field(None, description="Application base URL")
     
 class UserData(BaseModel):
+    model_config = _FROZEN
+
     id: str = Field(..., description="User ID")
     role: str = Field(..., description="User role")
     name: Optional[str] = Field(None, description="User name")
@@ -23,6 +31,8 @@ class UserData(BaseModel):
 
 
 class TokenResponse(BaseModel):
+    model_config = _FROZEN
+
     access_token: str = Field(..., description="JWT access token")
     refresh_token: str = Field(..., description="JWT refresh token")
     token_type: str = Field("bearer", description="Token type")
@@ -38,6 +48,8 @@ class LoginResponse(BaseModel):
     - device_id: Present if client_id was provided (save this for future logins)
     """
 
+    model_config = _FROZEN
+
     sso_token: str = Field(
         ..., description="Global SSO session token for token exchange"
     )
@@ -58,6 +70,8 @@ class LoginResponse(BaseModel):
 
 
 class RefreshResponse(BaseModel):
+    model_config = _FROZEN
+
     access_token: str = Field(..., description="New JWT access token")
     refresh_token: str = Field(..., description="New JWT refresh token")
     token_type: str = Field("bearer", description="Token type")
@@ -65,6 +79,8 @@ class RefreshResponse(BaseModel):
 
 
 class SessionInfo(BaseModel):
+    model_config = _FROZEN
+
     device_id: str = Field(..., description="Device ID")
     device_info: Optional[dict] = Field(None, description="Device information")
     ip_address: Optional[str] = Field(None, description="IP address")
@@ -73,6 +89,8 @@ class SessionInfo(BaseModel):
 
 
 class SessionListResponse(BaseModel):
+    model_config = _FROZEN
+
     sessions: List[SessionInfo] = Field(
         default_factory=list, description="Active sessions"
     )
@@ -1,7 +1,7 @@
 """Auth service facade - orchestrates authentication use cases."""
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
 from app.modules.auth.services.session_service import SessionService
 from app.modules.auth.services.sso_session_service import SSOSessionService
@@ -71,7 +71,7 @@ class AuthService:
 
     async def refresh_token(
         self,
-        refresh_token: str,
+        refresh_token: Union[str, bytes],
         device_id: str,
     ) -> RefreshResponse:
         """Refresh access token menggunakan refresh token."""
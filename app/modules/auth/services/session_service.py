@@ -1,10 +1,11 @@
 import json
 import uuid
 import hashlib
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from app.core.exceptions import BadRequestException
 
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 
 from app.config.settings import settings
 from app.core.utils import get_utc_now
@@ -16,12 +17,29 @@ class SessionService:
     USER_SESSIONS_PREFIX = "user_sessions"
     SESSION_TTL = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
+    # SMEMBERS user_sessions:{user} + GET of every session key in one round trip.
+    # Members are "client_id:device_id", so ARGV[1] .. member is the session key
+    _ALL_SESSIONS_LUA = """
+local pairs_ = redis.call('SMEMBERS', KEYS[1])
+local sessions = {}
+for _, pair in ipairs(pairs_) do
+    local data = redis.call('GET', ARGV[1] .. pair)
+    if data then
+        sessions[#sessions + 1] = data
+    end
+end
+return sessions
+"""
+
     def __init__(self, redis_client: redis.Redis):
         self.redis = redis_client
+        self._all_sessions_script = redis_client.register_script(self._ALL_SESSIONS_LUA)
 
     @staticmethod
-    def _hash_token(token: str) -> str:
-        return hashlib.sha256(token.encode()).hexdigest()
+    def _hash_token(token: Union[str, bytes]) -> str:
+        if isinstance(token, str):
+            token = token.encode()
+        return hashlib.sha256(token).hexdigest()
 
     def _session_key(self, user_id: str, client_id: str, device_id: str) -> str:
         """Session key: session:{user_id}:{client_id}:{device_id}"""
@@ -124,7 +142,7 @@ class SessionService:
         return None
 
     async def validate_refresh_token(
-        self, user_id: str, client_id: str, device_id: str, refresh_token: str
+        self, user_id: str, client_id: str, device_id: str, refresh_token: Union[str, bytes]
     ) -> bool:
         """Validate refresh token for specific session."""
         session = await self.get_session(user_id, client_id, device_id)
@@ -156,57 +174,85 @@ class SessionService:
         return True
 
     async def delete_client_device_session(
-        self, user_id: str, client_id: str, device_id: str
+        self,
+        user_id: str,
+        client_id: str,
+        device_id: str,
+        pipe: Optional[Pipeline] = None,
     ) -> bool:
-        """Delete specific device session for a client."""
-        session_key = self._session_key(user_id, client_id, device_id)
-        client_sessions_key = self._client_sessions_key(user_id, client_id)
-        user_sessions_key = self._user_sessions_key(user_id)
+        """Delete specific device session for a client.
+
+        Writes are queued on pipe when given (caller executes it), otherwise sent
+        as one non-transactional pipeline.
+        """
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+
+        pipe.delete(self._session_key(user_id, client_id, device_id))
+        pipe.srem(self._client_sessions_key(user_id, client_id), device_id)
+        pipe.srem(self._user_sessions_key(user_id), f"{client_id}:{device_id}")
 
-        await self.redis.delete(session_key)
-        await self.redis.srem(client_sessions_key, device_id)  # type: ignore
-        await self.redis.srem(user_sessions_key, f"{client_id}:{device_id}")  # type: ignore
+        if own_pipe:
+            await pipe.execute()
         return True
 
-    async def delete_client_sessions(self, user_id: str, client_id: str) -> int:
-        """Delete all sessions for a specific client (all devices)."""
+    async def delete_client_sessions(
+        self, user_id: str, client_id: str, pipe: Optional[Pipeline] = None
+    ) -> int:
+        """Delete all sessions for a specific client (all devices).
+
+        One SMEMBERS read, then every delete/SREM in a single pipeline round trip.
+        """
         client_sessions_key = self._client_sessions_key(user_id, client_id)
         device_ids = await self.redis.smembers(client_sessions_key)  # type: ignore
 
-        deleted_count = 0
-        for device_id in device_ids:
-            session_key = self._session_key(user_id, client_id, device_id)
-            await self.redis.delete(session_key)
-            deleted_count += 1
-
-            # Clean up from user_sessions
-            user_sessions_key = self._user_sessions_key(user_id)
-            await self.redis.srem(user_sessions_key, f"{client_id}:{device_id}")  # type: ignore
-
-        await self.redis.delete(client_sessions_key)
-        return deleted_count
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
 
-    async def delete_all_sessions(self, user_id: str) -> int:
-        """Delete all sessions for user (all clients, all devices)."""
+        for device_id in device_ids:
+            pipe.delete(self._session_key(user_id, client_id, device_id))
+        if device_ids:
+            pipe.srem(
+                self._user_sessions_key(user_id),
+                *(f"{client_id}:{device_id}" for device_id in device_ids),
+            )
+        pipe.delete(client_sessions_key)
+
+        if own_pipe:
+            await pipe.execute()
+        return len(device_ids)
+
+    async def delete_all_sessions(
+        self, user_id: str, pipe: Optional[Pipeline] = None
+    ) -> int:
+        """Delete all sessions for user (all clients, all devices).
+
+        One SMEMBERS read, then every delete/SREM in a single pipeline round trip.
+        """
         user_sessions_key = self._user_sessions_key(user_id)
         client_device_pairs = await self.redis.smembers(user_sessions_key)  # type: ignore
 
+        own_pipe = pipe is None
+        if own_pipe:
+            pipe = self.redis.pipeline(transaction=False)
+
         deleted_count = 0
         for pair in client_device_pairs:
             # pair format: "client_id:device_id"
             try:
                 client_id, device_id = pair.split(":", 1)
-                session_key = self._session_key(user_id, client_id, device_id)
-                await self.redis.delete(session_key)
-                deleted_count += 1
-
-                client_sessions_key = self._client_sessions_key(user_id, client_id)
-                await self.redis.srem(client_sessions_key, device_id)  # type: ignore
             except ValueError:
                 # Skip invalid format
                 continue
+            pipe.delete(self._session_key(user_id, client_id, device_id))
+            pipe.srem(self._client_sessions_key(user_id, client_id), device_id)
+            deleted_count += 1
+        pipe.delete(user_sessions_key)
 
-        await self.redis.delete(user_sessions_key)
+        if own_pipe:
+            await pipe.execute()
         return deleted_count
 
     async def get_client_sessions(
@@ -225,20 +271,9 @@ class SessionService:
         return sessions
 
     async def get_all_sessions(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all sessions for user (all clients)."""
-        user_sessions_key = self._user_sessions_key(user_id)
-        client_device_pairs = await self.redis.smembers(user_sessions_key)  # type: ignore
-
-        sessions = []
-        for pair in client_device_pairs:
-            # pair format: "client_id:device_id"
-            try:
-                client_id, device_id = pair.split(":", 1)
-                session = await self.get_session(user_id, client_id, device_id)
-                if session:
-                    sessions.append(session)
-            except ValueError:
-                # Skip invalid format
-                continue
-
-        return sessions
+        """Get all sessions for user (all clients) with a single Lua round trip."""
+        raw_sessions = await self._all_sessions_script(
+            keys=[self._user_sessions_key(user_id)],
+            args=[f"{self.SESSION_PREFIX}:{user_id}:"],
+        )
+        return [json.loads(data) for data in raw_sessions]
@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 
 from app.config.settings import settings
 from app.core.utils import get_utc_now
@@ -146,24 +147,29 @@ class SSOSessionService:
     async def _delete_sso_session_internal(self, user_id: str) -> None:
         """Internal method to delete SSO session."""
         session = await self.get_sso_session_by_user(user_id)
-        if session:
-            # Delete token lookup
-            token_hash = session.get("token_hash")
-            if token_hash:
-                token_key = self._sso_token_key(token_hash)
-                await self.redis.delete(token_key)
-
-        # Delete session
-        sso_key = self._sso_key(user_id)
-        await self.redis.delete(sso_key)
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_sso_delete(pipe, user_id, session)
+        await pipe.execute()
 
-    async def delete_sso_session(self, user_id: str) -> bool:
+    def _queue_sso_delete(
+        self, pipe: Pipeline, user_id: str, session: Optional[Dict[str, Any]]
+    ) -> None:
+        """Queue deletion of the token lookup (if known) and the session key."""
+        token_hash = session.get("token_hash") if session else None
+        if token_hash:
+            pipe.delete(self._sso_token_key(token_hash))
+        pipe.delete(self._sso_key(user_id))
+
+    async def delete_sso_session(
+        self, user_id: str, pipe: Optional[Pipeline] = None
+    ) -> bool:
         """
         Delete SSO session (global logout).
         This invalidates the SSO token but does NOT delete app sessions.
 
         Args:
             user_id: User UUID string
+            pipe: Optional pipeline to queue the deletes on; the caller executes it
 
         Returns:
             True if session was deleted, False if not found
@@ -172,7 +178,12 @@ class SSOSessionService:
         if not session:
             return False
 
-        await self._delete_sso_session_internal(user_id)
+        if pipe is None:
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_sso_delete(pipe, user_id, session)
+            await pipe.execute()
+        else:
+            self._queue_sso_delete(pipe, user_id, session)
         return True
 
     async def refresh_sso_session(self, sso_token: str) -> Optional[str]:
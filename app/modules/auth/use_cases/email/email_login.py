@@ -79,19 +79,19 @@ class EmailLoginUseCase:
             raise UnauthorizedException("Email atau password salah")
 
         # Cek auth provider
-        auth_provider = await self.auth_queries.get_by_provider_user_id(
+        identity = await self.auth_queries.get_identity(
             provider=AuthProvider.EMAIL.value,
             provider_user_id=email,
         )
-        if not auth_provider or not auth_provider.password_hash:
+        if not identity or not identity.password_hash:
             raise UnauthorizedException("Email atau password salah")
 
-        # Verify password
-        if not PasswordService.verify_password(password, auth_provider.password_hash):
+        # Verify password (bcrypt on the hash pool, off the event loop)
+        if not await PasswordService.verify_password_async(password, identity.password_hash):
             raise UnauthorizedException("Email atau password salah")
 
         # Update last used timestamp
-        await self.auth_commands.update_last_used(auth_provider)
+        await self.auth_commands.update_last_used(identity.id)
 
         # Validasi client access dan get single_session config
         app = await self.client_validator.validate_client_access(
@@ -69,15 +69,17 @@ class FirebaseLoginUseCase:
         firebase_user = await FirebaseService.verify_token(request.firebase_token)
 
         # Cek apakah sudah ada auth provider
-        auth_provider = await self.auth_queries.get_by_provider_user_id(
+        identity = await self.auth_queries.get_identity(
             provider=AuthProvider.FIREBASE.value,
             provider_user_id=firebase_user.uid,
         )
 
-        if auth_provider:
+        if identity:
             # Provider sudah ada, ambil user
-            user = auth_provider.user
-            await self.auth_commands.update_last_used(auth_provider)
+            user = await self.user_queries.get_by_id(identity.user_id)
+            if not user:
+                raise UnauthorizedException("User tidak terdaftar dalam sistem")
+            await self.auth_commands.update_last_used(identity.id)
         else:
             # Provider belum ada, cek apakah user sudah terdaftar via email
             if not firebase_user.email:
@@ -81,15 +81,17 @@ class GoogleOAuthHandleCallbackUseCase:
         )
 
         # Cek apakah sudah ada auth provider
-        auth_provider = await self.auth_queries.get_by_provider_user_id(
+        identity = await self.auth_queries.get_identity(
             provider=AuthProvider.GOOGLE.value,
             provider_user_id=google_user.google_id,
         )
 
-        if auth_provider:
+        if identity:
             # Provider sudah ada, ambil user
-            user = auth_provider.user
-            await self.auth_commands.update_last_used(auth_provider)
+            user = await self.user_queries.get_by_id(identity.user_id)
+            if not user:
+                raise UnauthorizedException("User tidak terdaftar dalam sistem")
+            await self.auth_commands.update_last_used(identity.id)
         else:
             # Provider belum ada, cek apakah user sudah terdaftar via email
             if not google_user.email:
@@ -31,10 +31,14 @@ class LogoutAllUseCase:
         """
         logger.info(f"Logout all attempt untuk user {user_id}")
 
-        # Hapus semua app sessions (all clients, all devices)
-        await self.session_service.delete_all_sessions(user_id)
+        # Semua delete dikirim dalam satu pipeline (satu round trip setelah read)
+        async with self.session_service.redis.pipeline(transaction=False) as pipe:
+            # Hapus semua app sessions (all clients, all devices)
+            await self.session_service.delete_all_sessions(user_id, pipe=pipe)
 
-        # Hapus SSO session
-        await self.sso_session_service.delete_sso_session(user_id)
+            # Hapus SSO session
+            await self.sso_session_service.delete_sso_session(user_id, pipe=pipe)
+
+            await pipe.execute()
 
         logger.info(f"User {user_id} logged out dari semua clients dan devices")
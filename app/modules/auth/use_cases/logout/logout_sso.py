@@ -34,10 +34,14 @@ class LogoutSSOUseCase:
         """
         logger.info(f"SSO logout attempt untuk user {user_id}")
 
-        # Hapus SSO session
-        await self.sso_session_service.delete_sso_session(user_id)
+        # Semua delete dikirim dalam satu pipeline (satu round trip setelah read)
+        async with self.session_service.redis.pipeline(transaction=False) as pipe:
+            # Hapus SSO session
+            await self.sso_session_service.delete_sso_session(user_id, pipe=pipe)
 
-        # Hapus session untuk sso_portal client
-        await self.session_service.delete_client_sessions(user_id, "sso_portal")
+            # Hapus session untuk sso_portal client
+            await self.session_service.delete_client_sessions(user_id, "sso_portal", pipe=pipe)
+
+            await pipe.execute()
 
         logger.info(f"User {user_id} SSO session deleted")
@@ -75,24 +75,24 @@ class ExchangeSSOTokenUseCase:
 
         # Validasi user exists
         user_id = sso_session["user_id"]
-        user = await self.user_queries.get_by_id(user_id)
+        user = await self.user_queries.get_by_id_with_applications(user_id)
         if not user:
             raise NotFoundException("User tidak ditemukan")
 
-        # Validasi aplikasi exists dan aktif
-        app = await self.app_queries.get_by_code(client_id)
+        # Aplikasi yang di-assign sudah ter-load bersama user, jadi cukup cari by code
+        app = next((a for a in user.applications if a.code == client_id), None)
+        if app is None:
+            # Tidak di-assign: satu lookup hanya untuk membedakan 403 dari 404
+            known_app = await self.app_queries.get_by_code(client_id)
+            if known_app and known_app.is_active:
+                raise ForbiddenException(
+                    f"User tidak memiliki akses ke aplikasi '{client_id}'"
+                )
         if not app or not app.is_active:
             raise NotFoundException(
                 f"Aplikasi '{client_id}' tidak ditemukan atau tidak aktif"
             )
 
-        # Validasi user memiliki akses ke aplikasi
-        user_apps = await self.app_queries.get_user_applications(user_id)
-        if str(app.id) not in [str(a.id) for a in user_apps]:
-            raise ForbiddenException(
-                f"User tidak memiliki akses ke aplikasi '{client_id}'"
-            )
-
         logger.info(f"Token exchange successful: {user_id} -> {client_id}")
 
         # Generate app-specific tokens dan create session
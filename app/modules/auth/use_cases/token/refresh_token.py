@@ -1,7 +1,7 @@
 """Use case untuk refresh access token menggunakan refresh token."""
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 from app.config.settings import settings
 from app.core.security import TokenService
@@ -29,7 +29,7 @@ class RefreshTokenUseCase:
 
     async def execute(
         self,
-        refresh_token: str,
+        refresh_token: Union[str, bytes],
         device_id: str,
     ) -> RefreshResponse:
         """
@@ -5,10 +5,15 @@ Utilities for converting PEM keys to JWK format and caching.
 """
 
 import base64
+import hashlib
+from typing import Tuple
+
+import orjson
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
 
 from app.config.settings import settings
+from app.core.security.jwt import TokenService
 
 
 def _int_to_base64url(n: int) -> str:
@@ -25,8 +30,9 @@ def get_jwk_from_pem() -> dict:
     """
     Convert PEM public key to JWK format.
 
-    Reads the public key from the configured path and converts it
-    to JSON Web Key (JWK) format suitable for JWKS endpoints.
+    Uses the public key PEM cached by TokenService (the same key tokens are
+    verified with) and converts it to JSON Web Key (JWK) format suitable for
+    JWKS endpoints.
 
     Returns:
         dict: JWK representation of the public key with fields:
@@ -37,8 +43,7 @@ def get_jwk_from_pem() -> dict:
             - n: Modulus (base64url encoded)
             - e: Exponent (base64url encoded)
     """
-    with open(settings.JWT_PUBLIC_KEY_PATH, "rb") as f:
-        pem_data = f.read()
+    pem_data = TokenService.get_public_key().encode()
 
     public_key = serialization.load_pem_public_key(pem_data, backend=default_backend())
 
@@ -73,3 +78,21 @@ def get_cached_jwk() -> dict:
     if _cached_jwk is None:
         _cached_jwk = get_jwk_from_pem()
     return _cached_jwk
+
+
+# Serialized JWKS document and its ETag; the key set is fixed for the process lifetime
+_cached_jwks_body: Tuple[bytes, str] | None = None
+
+
+def get_cached_jwks_body() -> Tuple[bytes, str]:
+    """
+    Get the pre-serialized JWKS document and its ETag.
+
+    Returns:
+        Tuple[bytes, str]: JSON body ``{"keys": [...]}`` and a quoted ETag
+    """
+    global _cached_jwks_body
+    if _cached_jwks_body is None:
+        body = orjson.dumps({"keys": [get_cached_jwk()]})
+        _cached_jwks_body = (body, f'"{hashlib.sha256(body).hexdigest()[:16]}"')
+    return _cached_jwks_body
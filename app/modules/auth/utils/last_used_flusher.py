@@ -0,0 +1,81 @@
+"""
+Periodic flush of buffered auth provider last_used_at timestamps to Postgres.
+
+Logins only HSET the timestamp into Redis (AuthProviderCommands.update_last_used);
+this loop drains the hash into one batched UPDATE every interval.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+from app.config.database import async_session_maker
+from app.config.redis import RedisClient
+from app.config.settings import settings
+from app.modules.auth.repositories import AuthProviderCommands
+from app.modules.auth.repositories.commands.auth_commands import LAST_USED_BUFFER_KEY
+
+logger = logging.getLogger(__name__)
+
+_DRAINING_KEY = f"{LAST_USED_BUFFER_KEY}:draining"
+
+# Every API/gRPC worker runs a flusher, so claiming has to be atomic: a plain EXISTS + RENAME
+# lets a second worker overwrite a draining hash that is still being flushed.
+# Keeps a leftover draining hash (failed flush) and only moves the buffer when it is gone.
+_CLAIM_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return 0
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return 1
+"""
+
+# Two workers may flush the same draining hash; drop only fields still holding the value
+# that was written, so a hash claimed after ours is never deleted by a late worker
+_RELEASE_LUA = """
+local removed = 0
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        removed = removed + redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return removed
+"""
+
+
+async def flush_last_used() -> int:
+    """Move the buffer aside, write it in one UPDATE, then drop it. Returns rows flushed."""
+    redis_client = await RedisClient.get_client()
+
+    # A leftover draining hash means the previous flush failed; retry it before taking new data
+    claim = redis_client.register_script(_CLAIM_LUA)
+    if not await claim(keys=[LAST_USED_BUFFER_KEY, _DRAINING_KEY]):
+        # Nothing buffered since the last flush
+        return 0
+
+    buffered = await redis_client.hgetall(_DRAINING_KEY)
+    if not buffered:
+        return 0
+    last_used = {int(provider_id): datetime.fromisoformat(ts) for provider_id, ts in buffered.items()}
+
+    async with async_session_maker() as session:
+        await AuthProviderCommands(session).bulk_update_last_used(last_used)
+        await session.commit()
+
+    release = redis_client.register_script(_RELEASE_LUA)
+    await release(keys=[_DRAINING_KEY], args=[item for pair in buffered.items() for item in pair])
+    return len(last_used)
+
+
+async def run_last_used_flusher(interval: float = settings.LAST_USED_FLUSH_INTERVAL) -> None:
+    """Flush forever until cancelled; errors are logged and retried next tick."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            count = await flush_last_used()
+            if count:
+                logger.debug("Flushed last_used_at for %s auth providers", count)
+        except Exception as e:
+            logger.warning(f"Failed to flush auth provider last_used_at: {e}")
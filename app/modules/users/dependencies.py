@@ -13,28 +13,28 @@ from app.core.messaging import EventPublisher, event_publisher
 from app.modules.users.services.user_service import UserService
 
 
-def get_user_queries(db: AsyncSession = Depends(get_db)) -> UserQueries:
+async def get_user_queries(db: AsyncSession = Depends(get_db)) -> UserQueries:
     return UserQueries(db)
 
 
 UserQueriesDep = Annotated[UserQueries, Depends(get_user_queries)]
 
 
-def get_user_commands(db: AsyncSession = Depends(get_db)) -> UserCommands:
+async def get_user_commands(db: AsyncSession = Depends(get_db)) -> UserCommands:
     return UserCommands(db)
 
 
 UserCommandsDep = Annotated[UserCommands, Depends(get_user_commands)]
 
 
-def get_event_publisher() -> EventPublisher:
+async def get_event_publisher() -> EventPublisher:
     return event_publisher
 
 
 EventPublisherDep = Annotated[EventPublisher, Depends(get_event_publisher)]
 
 
-def get_user_service(
+async def get_user_service(
     queries: UserQueriesDep,
     commands: UserCommandsDep,
     publisher: EventPublisherDep,
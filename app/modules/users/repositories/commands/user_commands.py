@@ -1,9 +1,15 @@
 import uuid
+from functools import partial
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, List, Dict, Any
+from sqlalchemy import exists, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.database import run_after_commit
+from app.modules.auth.repositories.queries.auth_queries import invalidate_user_identities
 from app.modules.users.models.user import User
+from app.modules.applications.models.application import Application
+from app.modules.applications.models.user_application import UserApplication
 from app.modules.users.schemas.requests import UserUpdateRequest
 from app.core.enums import UserRole, UserStatus
 
@@ -22,20 +28,31 @@ class UserCommands:
         role: UserRole = UserRole.USER,
         status: UserStatus = UserStatus.ACTIVE,
     ) -> User:
-        user = User(
-            id=uuid.uuid4(),
-            name=name,
-            email=email,
-            phone=phone,
-            avatar_path=avatar_path,
-            gender=gender, 
-            role=role.value if isinstance(role, UserRole) else role,
-            status=status.value if isinstance(status, UserStatus) else status,
+        # INSERT ... RETURNING loads server defaults (created_at/updated_at) in the same round trip
+        stmt = (
+            insert(User)
+            .values(
+                id=uuid.uuid4(),
+                name=name,
+                email=email,
+                phone=phone,
+                avatar_path=avatar_path,
+                gender=gender,
+                role=role.value if isinstance(role, UserRole) else role,
+                status=status.value if isinstance(status, UserStatus) else status,
+            )
+            .returning(User)
         )
-        self.session.add(user)
-        await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[User]:
+        """Insert many users in one INSERT ... RETURNING; results follow the order of rows."""
+        if not rows:
+            return []
+        stmt = insert(User).returning(User, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, rows)
+        return list(result.scalars().all())
 
     async def update(self, user: User, data: UserUpdateRequest) -> User:
         """
@@ -59,6 +76,26 @@ class UserCommands:
         user.status = UserStatus.DELETED.value
         user.deleted_at = datetime.now(timezone.utc)
         await self.session.flush()
+        run_after_commit(self.session, partial(invalidate_user_identities, user.id))
+
+    async def soft_delete_if_no_applications(self, user_id: str) -> bool:
+        """Soft delete the user in one UPDATE if no (non-deleted) applications remain."""
+        has_apps = exists().where(
+            UserApplication.user_id == User.id,
+            UserApplication.application_id == Application.id,
+            Application.deleted_at.is_(None),
+        )
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.deleted_at.is_(None), ~has_apps)
+            .values(status=UserStatus.DELETED.value, deleted_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        if result.rowcount > 0:
+            run_after_commit(self.session, partial(invalidate_user_identities, user_id))
+            return True
+        return False
 
     async def restore(self, user: User) -> None:
         """Restore a soft-deleted user."""
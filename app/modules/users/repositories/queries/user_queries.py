@@ -1,6 +1,7 @@
 from typing import Optional, List
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.modules.users.models.user import User
 
@@ -14,6 +15,24 @@ class UserQueries:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_id_with_applications(self, user_id: str) -> Optional[User]:
+        """Get user with applications loaded (batched IN, same execute); deleted apps are filtered by loader criteria."""
+        stmt = (
+            select(User)
+            .options(selectinload(User.applications))
+            .where(User.id == user_id, User.deleted_at.is_(None))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_by_ids(self, user_ids: List[str]) -> List[User]:
+        """Get multiple users by ID in a single query. Missing IDs are skipped."""
+        if not user_ids:
+            return []
+        stmt = select(User).where(User.id.in_(user_ids), User.deleted_at.is_(None))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_id_include_deleted(self, user_id: str) -> Optional[User]:
         """Get user by ID including soft-deleted users (for restore)."""
         stmt = select(User).where(User.id == user_id)
@@ -25,6 +44,14 @@ class UserQueries:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_existing_emails(self, emails: List[str]) -> set[str]:
+        """Return which of the given emails are already taken (including soft-deleted users)."""
+        if not emails:
+            return set()
+        stmt = select(User.email).where(User.email.in_(emails))
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def get_by_phone(self, phone: str) -> Optional[User]:
         stmt = select(User).where(User.phone == phone, User.deleted_at.is_(None))
         result = await self.session.execute(stmt)
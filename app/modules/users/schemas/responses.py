@@ -1,6 +1,6 @@
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field, field_serializer, computed_field
+from pydantic import BaseModel, Field, computed_field
 from datetime import datetime
 
 from app.core.enums import UserRole, UserStatus
@@ -22,10 +22,6 @@ class UserListItemResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_serializer("id")
-    def serialize_id(self, v: UUID, _info):
-        return str(v)
-
     @computed_field
     @property
     def avatar_url(self) -> Optional[str]:
@@ -52,10 +48,6 @@ class UserResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_serializer("id")
-    def serialize_id(self, v: UUID, _info):
-        return str(v)
-
     @computed_field
     @property
     def avatar_url(self) -> Optional[str]:
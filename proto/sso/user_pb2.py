@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14proto/sso/user.proto\x12\x03sso\x1a\x1fgoogle/protobuf/timestamp.proto\"\x84\x02\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\x05\x65mail\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05phone\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x61vatar_path\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x0c\n\x04role\x18\x07 \x01(\t\x12.\n\ncreated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x08\n\x06_emailB\x08\n\x06_phoneB\x0e\n\x0c_avatar_path\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"&\n\x15GetUserByEmailRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"&\n\x15GetUserByPhoneRequest\x12\r\n\x05phone\x18\x01 \x01(\t\"(\n\x14\x42\x61tchGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"1\n\x15\x42\x61tchGetUsersResponse\x12\x18\n\x05users\x18\x01 \x03(\x0b\x32\t.sso.User\"D\n\x0cUserResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x1c\n\x04user\x18\x02 \x01(\x0b\x32\t.sso.UserH\x00\x88\x01\x01\x42\x07\n\x05_user\"\x93\x01\n\x11\x43reateUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\x05phone\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x15\n\x08password\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tapp_codes\x18\x06 \x03(\tB\x08\n\x06_phoneB\x0b\n\t_password\"\xa2\x01\n\x12\x43reateUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x04user\x18\x03 \x01(\x0b\x32\t.sso.UserH\x01\x88\x01\x01\x12\x1f\n\x12temporary_password\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x08\n\x06_errorB\x07\n\x05_userB\x15\n\x13_temporary_password\"\xb8\x01\n\x11UpdateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05phone\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04role\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x13\n\x06status\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x08\n\x06_emailB\x08\n\x06_phoneB\x07\n\x05_roleB\t\n\x07_status\"j\n\x12UpdateUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x04user\x18\x03 \x01(\x0b\x32\t.sso.UserH\x01\x88\x01\x01\x42\x08\n\x06_errorB\x07\n\x05_user\"?\n\x19RemoveUserFromAppsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tapp_codes\x18\x02 \x03(\t\"c\n\x1aRemoveUserFromAppsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\x0eremaining_apps\x18\x03 \x01(\x05\x42\x08\n\x06_error\"=\n\x17\x41ssignUserToAppsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tapp_codes\x18\x02 \x03(\t\"I\n\x18\x41ssignUserToAppsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_error2\xb0\x04\n\x0bUserService\x12\x31\n\x07GetUser\x12\x13.sso.GetUserRequest\x1a\x11.sso.UserResponse\x12?\n\x0eGetUserByEmail\x12\x1a.sso.GetUserByEmailRequest\x1a\x11.sso.UserResponse\x12?\n\x0eGetUserByPhone\x12\x1a.sso.GetUserByPhoneRequest\x1a\x11.sso.UserResponse\x12\x46\n\rBatchGetUsers\x12\x19.sso.BatchGetUsersRequest\x1a\x1a.sso.BatchGetUsersResponse\x12=\n\nCreateUser\x12\x16.sso.CreateUserRequest\x1a\x17.sso.CreateUserResponse\x12=\n\nUpdateUser\x12\x16.sso.UpdateUserRequest\x1a\x17.sso.UpdateUserResponse\x12U\n\x12RemoveUserFromApps\x12\x1e.sso.RemoveUserFromAppsRequest\x1a\x1f.sso.RemoveUserFromAppsResponse\x12O\n\x10\x41ssignUserToApps\x12\x1c.sso.AssignUserToAppsRequest\x1a\x1d.sso.AssignUserToAppsResponseB6Z4github.com/ahmdfdhilah/arga-sso-service-v2/proto/ssob\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14proto/sso/user.proto\x12\x03sso\x1a\x1fgoogle/protobuf/timestamp.proto\"\x84\x02\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\x05\x65mail\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05phone\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x61vatar_path\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x0c\n\x04role\x18\x07 \x01(\t\x12.\n\ncreated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampB\x08\n\x06_emailB\x08\n\x06_phoneB\x0e\n\x0c_avatar_path\"!\n\x0eGetUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"&\n\x15GetUserByEmailRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"&\n\x15GetUserByPhoneRequest\x12\r\n\x05phone\x18\x01 \x01(\t\"(\n\x14\x42\x61tchGetUsersRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"1\n\x15\x42\x61tchGetUsersResponse\x12\x18\n\x05users\x18\x01 \x03(\x0b\x32\t.sso.User\"D\n\x0cUserResponse\x12\r\n\x05\x66ound\x18\x01 \x01(\x08\x12\x1c\n\x04user\x18\x02 \x01(\x0b\x32\t.sso.UserH\x00\x88\x01\x01\x42\x07\n\x05_user\"\x93\x01\n\x11\x43reateUserRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\x05phone\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x15\n\x08password\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tapp_codes\x18\x06 \x03(\tB\x08\n\x06_phoneB\x0b\n\t_password\"\xa2\x01\n\x12\x43reateUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x04user\x18\x03 \x01(\x0b\x32\t.sso.UserH\x01\x88\x01\x01\x12\x1f\n\x12temporary_password\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x08\n\x06_errorB\x07\n\x05_userB\x15\n\x13_temporary_password\"\xb8\x01\n\x11UpdateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05\x65mail\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05phone\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04role\x18\x05 \x01(\tH\x03\x88\x01\x01\x12\x13\n\x06status\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x08\n\x06_emailB\x08\n\x06_phoneB\x07\n\x05_roleB\t\n\x07_status\"j\n\x12UpdateUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x04user\x18\x03 \x01(\x0b\x32\t.sso.UserH\x01\x88\x01\x01\x42\x08\n\x06_errorB\x07\n\x05_user\"?\n\x19RemoveUserFromAppsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tapp_codes\x18\x02 \x03(\t\"c\n\x1aRemoveUserFromAppsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\x0eremaining_apps\x18\x03 \x01(\x05\x42\x08\n\x06_error\"=\n\x17\x41ssignUserToAppsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tapp_codes\x18\x02 \x03(\t\"I\n\x18\x41ssignUserToAppsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_error2\xc0\x05\n\x0bUserService\x12\x31\n\x07GetUser\x12\x13.sso.GetUserRequest\x1a\x11.sso.UserResponse\x12?\n\x0eGetUserByEmail\x12\x1a.sso.GetUserByEmailRequest\x1a\x11.sso.UserResponse\x12?\n\x0eGetUserByPhone\x12\x1a.sso.GetUserByPhoneRequest\x1a\x11.sso.UserResponse\x12\x46\n\rBatchGetUsers\x12\x19.sso.BatchGetUsersRequest\x1a\x1a.sso.BatchGetUsersResponse\x12\x45\n\x13StreamBatchGetUsers\x12\x19.sso.BatchGetUsersRequest\x1a\x11.sso.UserResponse0\x01\x12=\n\nCreateUser\x12\x16.sso.CreateUserRequest\x1a\x17.sso.CreateUserResponse\x12=\n\nUpdateUser\x12\x16.sso.UpdateUserRequest\x1a\x17.sso.UpdateUserResponse\x12G\n\x10\x42\x61tchCreateUsers\x12\x16.sso.CreateUserRequest\x1a\x17.sso.CreateUserResponse(\x01\x30\x01\x12U\n\x12RemoveUserFromApps\x12\x1e.sso.RemoveUserFromAppsRequest\x1a\x1f.sso.RemoveUserFromAppsResponse\x12O\n\x10\x41ssignUserToApps\x12\x1c.sso.AssignUserToAppsRequest\x1a\x1d.sso.AssignUserToAppsResponseB6Z4github.com/ahmdfdhilah/arga-sso-service-v2/proto/ssob\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -64,5 +64,5 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ASSIGNUSERTOAPPSRESPONSE']._serialized_start=1442
   _globals['_ASSIGNUSERTOAPPSRESPONSE']._serialized_end=1515
   _globals['_USERSERVICE']._serialized_start=1518
-  _globals['_USERSERVICE']._serialized_end=2078
+  _globals['_USERSERVICE']._serialized_end=2222
 # @@protoc_insertion_point(module_scope)
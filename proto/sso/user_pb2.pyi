@@ -7,7 +7,7 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class User(_message.Message):
-    __slots__ = ("id", "name", "email", "phone", "avatar_path", "status", "role", "created_at", "updated_at", "alias", "gender", "date_of_birth", "address", "bio")
+    __slots__ = ("id", "name", "email", "phone", "avatar_path", "status", "role", "created_at", "updated_at")
     ID_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     EMAIL_FIELD_NUMBER: _ClassVar[int]
@@ -17,11 +17,6 @@ class User(_message.Message):
     ROLE_FIELD_NUMBER: _ClassVar[int]
     CREATED_AT_FIELD_NUMBER: _ClassVar[int]
     UPDATED_AT_FIELD_NUMBER: _ClassVar[int]
-    ALIAS_FIELD_NUMBER: _ClassVar[int]
-    GENDER_FIELD_NUMBER: _ClassVar[int]
-    DATE_OF_BIRTH_FIELD_NUMBER: _ClassVar[int]
-    ADDRESS_FIELD_NUMBER: _ClassVar[int]
-    BIO_FIELD_NUMBER: _ClassVar[int]
     id: str
     name: str
     email: str
@@ -31,12 +26,7 @@ class User(_message.Message):
     role: str
     created_at: _timestamp_pb2.Timestamp
     updated_at: _timestamp_pb2.Timestamp
-    alias: str
-    gender: str
-    date_of_birth: _timestamp_pb2.Timestamp
-    address: str
-    bio: str
-    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., avatar_path: _Optional[str] = ..., status: _Optional[str] = ..., role: _Optional[str] = ..., created_at: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., alias: _Optional[str] = ..., gender: _Optional[str] = ..., date_of_birth: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., address: _Optional[str] = ..., bio: _Optional[str] = ...) -> None: ...
+    def __init__(self, id: _Optional[str] = ..., name: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., avatar_path: _Optional[str] = ..., status: _Optional[str] = ..., role: _Optional[str] = ..., created_at: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
 
 class GetUserRequest(_message.Message):
     __slots__ = ("user_id",)
@@ -77,28 +67,20 @@ class UserResponse(_message.Message):
     def __init__(self, found: bool = ..., user: _Optional[_Union[User, _Mapping]] = ...) -> None: ...
 
 class CreateUserRequest(_message.Message):
-    __slots__ = ("email", "name", "phone", "role", "password", "alias", "gender", "date_of_birth", "address", "bio")
+    __slots__ = ("email", "name", "phone", "role", "password", "app_codes")
     EMAIL_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     PHONE_FIELD_NUMBER: _ClassVar[int]
     ROLE_FIELD_NUMBER: _ClassVar[int]
     PASSWORD_FIELD_NUMBER: _ClassVar[int]
-    ALIAS_FIELD_NUMBER: _ClassVar[int]
-    GENDER_FIELD_NUMBER: _ClassVar[int]
-    DATE_OF_BIRTH_FIELD_NUMBER: _ClassVar[int]
-    ADDRESS_FIELD_NUMBER: _ClassVar[int]
-    BIO_FIELD_NUMBER: _ClassVar[int]
+    APP_CODES_FIELD_NUMBER: _ClassVar[int]
     email: str
     name: str
     phone: str
     role: str
     password: str
-    alias: str
-    gender: str
-    date_of_birth: _timestamp_pb2.Timestamp
-    address: str
-    bio: str
-    def __init__(self, email: _Optional[str] = ..., name: _Optional[str] = ..., phone: _Optional[str] = ..., role: _Optional[str] = ..., password: _Optional[str] = ..., alias: _Optional[str] = ..., gender: _Optional[str] = ..., date_of_birth: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., address: _Optional[str] = ..., bio: _Optional[str] = ...) -> None: ...
+    app_codes: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, email: _Optional[str] = ..., name: _Optional[str] = ..., phone: _Optional[str] = ..., role: _Optional[str] = ..., password: _Optional[str] = ..., app_codes: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class CreateUserResponse(_message.Message):
     __slots__ = ("success", "error", "user", "temporary_password")
@@ -113,30 +95,20 @@ class CreateUserResponse(_message.Message):
     def __init__(self, success: bool = ..., error: _Optional[str] = ..., user: _Optional[_Union[User, _Mapping]] = ..., temporary_password: _Optional[str] = ...) -> None: ...
 
 class UpdateUserRequest(_message.Message):
-    __slots__ = ("user_id", "name", "email", "phone", "role", "status", "alias", "gender", "date_of_birth", "address", "bio")
+    __slots__ = ("user_id", "name", "email", "phone", "role", "status")
     USER_ID_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     EMAIL_FIELD_NUMBER: _ClassVar[int]
     PHONE_FIELD_NUMBER: _ClassVar[int]
     ROLE_FIELD_NUMBER: _ClassVar[int]
     STATUS_FIELD_NUMBER: _ClassVar[int]
-    ALIAS_FIELD_NUMBER: _ClassVar[int]
-    GENDER_FIELD_NUMBER: _ClassVar[int]
-    DATE_OF_BIRTH_FIELD_NUMBER: _ClassVar[int]
-    ADDRESS_FIELD_NUMBER: _ClassVar[int]
-    BIO_FIELD_NUMBER: _ClassVar[int]
     user_id: str
     name: str
     email: str
     phone: str
     role: str
     status: str
-    alias: str
-    gender: str
-    date_of_birth: _timestamp_pb2.Timestamp
-    address: str
-    bio: str
-    def __init__(self, user_id: _Optional[str] = ..., name: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., role: _Optional[str] = ..., status: _Optional[str] = ..., alias: _Optional[str] = ..., gender: _Optional[str] = ..., date_of_birth: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., address: _Optional[str] = ..., bio: _Optional[str] = ...) -> None: ...
+    def __init__(self, user_id: _Optional[str] = ..., name: _Optional[str] = ..., email: _Optional[str] = ..., phone: _Optional[str] = ..., role: _Optional[str] = ..., status: _Optional[str] = ...) -> None: ...
 
 class UpdateUserResponse(_message.Message):
     __slots__ = ("success", "error", "user")
@@ -148,13 +120,33 @@ class UpdateUserResponse(_message.Message):
     user: User
     def __init__(self, success: bool = ..., error: _Optional[str] = ..., user: _Optional[_Union[User, _Mapping]] = ...) -> None: ...
 
-class DeleteUserRequest(_message.Message):
-    __slots__ = ("user_id",)
+class RemoveUserFromAppsRequest(_message.Message):
+    __slots__ = ("user_id", "app_codes")
     USER_ID_FIELD_NUMBER: _ClassVar[int]
+    APP_CODES_FIELD_NUMBER: _ClassVar[int]
     user_id: str
-    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+    app_codes: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, user_id: _Optional[str] = ..., app_codes: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class RemoveUserFromAppsResponse(_message.Message):
+    __slots__ = ("success", "error", "remaining_apps")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    REMAINING_APPS_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    error: str
+    remaining_apps: int
+    def __init__(self, success: bool = ..., error: _Optional[str] = ..., remaining_apps: _Optional[int] = ...) -> None: ...
+
+class AssignUserToAppsRequest(_message.Message):
+    __slots__ = ("user_id", "app_codes")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    APP_CODES_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    app_codes: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, user_id: _Optional[str] = ..., app_codes: _Optional[_Iterable[str]] = ...) -> None: ...
 
-class DeleteUserResponse(_message.Message):
+class AssignUserToAppsResponse(_message.Message):
     __slots__ = ("success", "error")
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
@@ -54,6 +54,11 @@ class UserServiceStub(object):
                 request_serializer=proto_dot_sso_dot_user__pb2.BatchGetUsersRequest.SerializeToString,
                 response_deserializer=proto_dot_sso_dot_user__pb2.BatchGetUsersResponse.FromString,
                 _registered_method=True)
+        self.StreamBatchGetUsers = channel.unary_stream(
+                '/sso.UserService/StreamBatchGetUsers',
+                request_serializer=proto_dot_sso_dot_user__pb2.BatchGetUsersRequest.SerializeToString,
+                response_deserializer=proto_dot_sso_dot_user__pb2.UserResponse.FromString,
+                _registered_method=True)
         self.CreateUser = channel.unary_unary(
                 '/sso.UserService/CreateUser',
                 request_serializer=proto_dot_sso_dot_user__pb2.CreateUserRequest.SerializeToString,
@@ -64,6 +69,11 @@ class UserServiceStub(object):
                 request_serializer=proto_dot_sso_dot_user__pb2.UpdateUserRequest.SerializeToString,
                 response_deserializer=proto_dot_sso_dot_user__pb2.UpdateUserResponse.FromString,
                 _registered_method=True)
+        self.BatchCreateUsers = channel.stream_stream(
+                '/sso.UserService/BatchCreateUsers',
+                request_serializer=proto_dot_sso_dot_user__pb2.CreateUserRequest.SerializeToString,
+                response_deserializer=proto_dot_sso_dot_user__pb2.CreateUserResponse.FromString,
+                _registered_method=True)
         self.RemoveUserFromApps = channel.unary_unary(
                 '/sso.UserService/RemoveUserFromApps',
                 request_serializer=proto_dot_sso_dot_user__pb2.RemoveUserFromAppsRequest.SerializeToString,
@@ -104,6 +114,13 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamBatchGetUsers(self, request, context):
+        """Streaming batch read: one UserResponse per requested id (same order, found=false if missing)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateUser(self, request, context):
         """Write operations (for HRIS integration)
         """
@@ -117,6 +134,13 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCreateUsers(self, request_iterator, context):
+        """Bulk create: one transaction for the whole stream, one response per request (same order)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def RemoveUserFromApps(self, request, context):
         """App assignment operations (delete is now app-specific, not user-delete)
         """
@@ -153,6 +177,11 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=proto_dot_sso_dot_user__pb2.BatchGetUsersRequest.FromString,
                     response_serializer=proto_dot_sso_dot_user__pb2.BatchGetUsersResponse.SerializeToString,
             ),
+            'StreamBatchGetUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBatchGetUsers,
+                    request_deserializer=proto_dot_sso_dot_user__pb2.BatchGetUsersRequest.FromString,
+                    response_serializer=proto_dot_sso_dot_user__pb2.UserResponse.SerializeToString,
+            ),
             'CreateUser': grpc.unary_unary_rpc_method_handler(
                     servicer.CreateUser,
                     request_deserializer=proto_dot_sso_dot_user__pb2.CreateUserRequest.FromString,
@@ -163,6 +192,11 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=proto_dot_sso_dot_user__pb2.UpdateUserRequest.FromString,
                     response_serializer=proto_dot_sso_dot_user__pb2.UpdateUserResponse.SerializeToString,
             ),
+            'BatchCreateUsers': grpc.stream_stream_rpc_method_handler(
+                    servicer.BatchCreateUsers,
+                    request_deserializer=proto_dot_sso_dot_user__pb2.CreateUserRequest.FromString,
+                    response_serializer=proto_dot_sso_dot_user__pb2.CreateUserResponse.SerializeToString,
+            ),
             'RemoveUserFromApps': grpc.unary_unary_rpc_method_handler(
                     servicer.RemoveUserFromApps,
                     request_deserializer=proto_dot_sso_dot_user__pb2.RemoveUserFromAppsRequest.FromString,
@@ -292,6 +326,33 @@ class UserService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamBatchGetUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/sso.UserService/StreamBatchGetUsers',
+            proto_dot_sso_dot_user__pb2.BatchGetUsersRequest.SerializeToString,
+            proto_dot_sso_dot_user__pb2.UserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CreateUser(request,
             target,
@@ -346,6 +407,33 @@ class UserService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchCreateUsers(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/sso.UserService/BatchCreateUsers',
+            proto_dot_sso_dot_user__pb2.CreateUserRequest.SerializeToString,
+            proto_dot_sso_dot_user__pb2.CreateUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def RemoveUserFromApps(request,
             target,